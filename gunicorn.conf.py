@@ -0,0 +1,27 @@
+"""
+Gunicorn configuration for production deployment, picked up automatically
+from the working directory (see Procfile and railway.json).
+"""
+import os
+import sys
+
+# Same path setup as wsgi.py, so the CPU detection of the app can be reused
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from app.core.utils import available_cpu_count
+from app.core.constants import MERGE_WORKERS_ENV
+
+# Schedule searches are CPU bound and the validator keeps module-level caches
+# that are not shared safely between threads, so scale with worker processes
+# rather than threads. Each worker holds its own copy of the API and page
+# caches, so the default stays small; WEB_CONCURRENCY overrides it.
+cpus = available_cpu_count()
+workers = int(os.environ.get("WEB_CONCURRENCY", min(cpus, 4)))
+worker_class = "sync"
+
+# Large searches spread their merge over a process pool; split the usable
+# CPUs between the web workers instead of giving each worker all of them
+os.environ.setdefault(MERGE_WORKERS_ENV, str(max(cpus // workers, 1)))
+
+# Large searches can take longer than gunicorn's default 30 second timeout
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 120))
@@ -116,6 +116,7 @@ pyinstaller --onefile ^
     --hidden-import "app.core.parser" ^
     --hidden-import "app.core.schedule_generator" ^
     --hidden-import "app.core.validator" ^
+    --hidden-import "app.core.validator_kernel" ^
     --hidden-import "app.core.constants" ^
     --hidden-import "app.ui" ^
     --hidden-import "app.ui.interactive" ^
@@ -173,6 +174,7 @@ pyinstaller --onefile ^
     --hidden-import "app.core.parser" ^
     --hidden-import "app.core.schedule_generator" ^
     --hidden-import "app.core.validator" ^
+    --hidden-import "app.core.validator_kernel" ^
     --hidden-import "app.core.constants" ^
     --hidden-import "app.ui" ^
     --hidden-import "app.ui.interactive" ^
@@ -112,6 +112,7 @@ pyinstaller --onefile \
     --hidden-import "app.core.parser" \
     --hidden-import "app.core.schedule_generator" \
     --hidden-import "app.core.validator" \
+    --hidden-import "app.core.validator_kernel" \
     --hidden-import "app.core.constants" \
     --hidden-import "app.ui" \
     --hidden-import "app.ui.interactive" \
@@ -168,6 +169,7 @@ pyinstaller --onefile \
     --hidden-import "app.core.parser" \
     --hidden-import "app.core.schedule_generator" \
     --hidden-import "app.core.validator" \
+    --hidden-import "app.core.validator_kernel" \
     --hidden-import "app.core.constants" \
     --hidden-import "app.ui" \
     --hidden-import "app.ui.interactive" \
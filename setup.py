@@ -1,11 +1,25 @@
+import os
+
 from setuptools import setup, find_packages
 
+# Optionally compile the schedule validation kernel to a C extension with
+# mypyc (pip install mypy). The pure Python module is used when not compiled.
+ext_modules = []
+if os.environ.get("FIB_MANAGER_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify([
+        "--ignore-missing-imports",
+        "--follow-imports=silent",
+        "src/app/core/validator.py",
+    ])
+
 setup(
     name="fib-manager",
     version="1.0.0",
     description="FIB Manager - A tool to search and generate valid class schedules for FIB degrees.",
     package_dir={'': 'src'},
     packages=find_packages(where='src'),
+    ext_modules=ext_modules,
     entry_points={
         'console_scripts': [
             'fib-manager=app.commands.command_line:main',
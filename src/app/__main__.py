@@ -1,6 +1,7 @@
 import sys
 import traceback
 import os
+import multiprocessing
 
 # Add the src directory to the Python path for proper imports
 if hasattr(sys, '_MEIPASS'):
@@ -12,10 +13,13 @@ else:
     src_dir = os.path.dirname(current_dir)
     sys.path.insert(0, src_dir)
 
-try:
-    from app.commands.command_line import main
-    main()
-except Exception as e:
-    print(f"Error in FIB Manager: {e}")
-    traceback.print_exc()
-    sys.exit(1)
\ No newline at end of file
+if __name__ == "__main__":
+    # Required so schedule-merging worker processes start correctly in frozen executables
+    multiprocessing.freeze_support()
+    try:
+        from app.commands.command_line import main
+        main()
+    except Exception as e:
+        print(f"Error in FIB Manager: {e}")
+        traceback.print_exc()
+        sys.exit(1)
\ No newline at end of file
@@ -6,7 +6,7 @@ import logging
 import requests
 from typing import Dict, List, Any
 
-from app.core.constants import API_BASE_URL, CLIENT_ID, LANGUAGE_MAPPING, DEFAULT_LANGUAGE
+from app.core.constants import API_BASE_URL, API_TIMEOUT_SECONDS, CLIENT_ID, LANGUAGE_MAPPING, DEFAULT_LANGUAGE
 
 # Initialize module logger
 logger = logging.getLogger(__name__)
@@ -15,6 +15,8 @@ def get_json_response(url: str, language: str) -> Dict[str, Any]:
     """
     Make a GET request to the API and return the JSON response.
     
+    Requests that time out are treated like any other failed request.
+    
     Args:
         url: The URL to request
         language: The language code for the request
@@ -23,7 +25,11 @@ def get_json_response(url: str, language: str) -> Dict[str, Any]:
         Dictionary containing the JSON response
     """
     headers = {"Accept-Language": language}
-    response = requests.get(url, headers=headers)
+    try:
+        response = requests.get(url, headers=headers, timeout=API_TIMEOUT_SECONDS)
+    except requests.Timeout:
+        logger.error("Failed to fetch data: timed out after %s seconds", API_TIMEOUT_SECONDS)
+        return {"results": []}
     if response.status_code != 200:
         logger.error("Failed to fetch data: HTTP %s", response.status_code)
         return {"results": []}
@@ -7,7 +7,6 @@ import json
 from argparse import ArgumentParser, Namespace
 
 from app.core.utils import get_default_quadrimester
-from app.ui.interactive import run_interactive_app
 from app.ui.ui import check_windows_interactive
 from app.commands.search import add_search_arguments, handle_search_command
 from app.commands.subjects import add_subjects_arguments, handle_subjects_command
@@ -43,6 +42,9 @@ def handle_app_command(args: Namespace) -> None:
     if not check_windows_interactive():
         return
     
+    # The interactive app pulls in questionary; only load it for this command
+    from app.ui.interactive import run_interactive_app
+    
     try:
         run_interactive_app()
     except Exception as e:
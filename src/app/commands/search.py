@@ -8,9 +8,6 @@ from argparse import ArgumentParser, Namespace
 
 from app.core.utils import normalize_languages, parse_blacklist, parse_whitelist
 from app.core.constants import SORT_MODE_GROUPS, SORT_MODE_DEAD_HOURS
-from app.api import fetch_classes_data
-from app.core.parser import parse_classes_data
-from app.core.schedule_generator import get_schedule_combinations
 from app.ui.ui import navigate_schedules, check_windows_interactive
 
 
@@ -125,6 +122,12 @@ def perform_schedule_search(
     Returns:
         Tuple of (search_result, parsed_data, group_schedule, subgroup_schedule)
     """
+    # Imported here so the interactive app can draw its splash screen before
+    # the API client and the validator are loaded
+    from app.api import fetch_classes_data
+    from app.core.parser import parse_classes_data
+    from app.core.schedule_generator import get_schedule_combinations
+    
     # Normalize input data
     normalized_subjects = [s.upper() for s in subjects]
     blacklist_parsed = parse_blacklist(blacklisted)
@@ -7,8 +7,6 @@ import sys
 from argparse import ArgumentParser, Namespace
 
 from app.core.utils import normalize_language
-from app.core.parser import parse_classes_data
-from app.api import fetch_classes_data, fetch_subject_names
 from app.ui.ui import display_subjects_list, check_windows_interactive
 
 
@@ -49,6 +47,10 @@ def handle_subjects_command(args: Namespace) -> None:
     Args:
         args: ArgumentParser arguments
     """
+    # Imported here, like in the search command, to keep the API client off start-up
+    from app.api import fetch_classes_data, fetch_subject_names
+    from app.core.parser import parse_classes_data
+    
     # Normalize language input
     normalized_lang = normalize_language(args.language)
     
@@ -7,6 +7,7 @@ API_BASE_URL = "https://api.fib.upc.edu/v2"
 CLIENT_ID = "77qvbbQqni4TcEUsWvUCKOG1XU7Hr0EfIs4pacRz"
 LANGUAGE_MAPPING = {"en": "en", "es": "es", "ca": "ca", "": "en"}
 DEFAULT_LANGUAGE = "ca"
+API_TIMEOUT_SECONDS = 15  # per request, so a stalled connection cannot hang a fetch
 
 # UI constants
 FILLED_BAR_COLOR = "#AA0000 bold"  # dark red bar
@@ -37,3 +38,7 @@ WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
 # Sort modes
 SORT_MODE_GROUPS = "groups"
 SORT_MODE_DEAD_HOURS = "dead_hours"
+
+# Environment variable overriding the number of schedule merge worker
+# processes, which defaults to the usable CPUs (set by gunicorn.conf.py)
+MERGE_WORKERS_ENV = "FIB_MERGE_WORKERS"
@@ -2,8 +2,12 @@
 Module for parsing and processing class data.
 """
 
+import sys
 from typing import Dict, List, Tuple, Any
 
+from app.core.constants import LANG_FLAGS
+from app.core.utils import normalize_language
+
 def extract_class_info(class_entry: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Extract class information from a class entry.
@@ -27,6 +31,13 @@ def extract_class_info(class_entry: Dict[str, Any]) -> List[Dict[str, Any]]:
         "day": class_entry.get("dia_setmana", 0),
         "group": int(class_entry.get("grup", 0)),
     }
+    # Display fields derived once here rather than on every schedule grid redraw;
+    # the API sends null for some of these, which must not break parsing
+    classroom = base_info["classroom"]
+    base_info["_classroom"] = classroom.replace(",", "") if isinstance(classroom, str) else ""
+    base_info["_flags"] = " ".join(LANG_FLAGS.get(normalize_language(lang.strip()), "")
+                                   for lang in (class_entry.get("idioma") or "").split(",") if lang.strip())
+    base_info["_type_letter"] = (class_entry.get("tipus") or "")[:1].upper()
     return [dict(base_info, hour=start_hour + offset) for offset in range(duration)]
 
 
@@ -63,8 +74,9 @@ def parse_classes_data(data: Dict[str, Any]) -> Dict[str, Any]:
     for entry in data.get("results", []):
         if not is_valid_class_entry(entry):
             continue
-        subject = entry.get("codi_assig")
-        group_key = str(entry.get("grup"))
+        # Interned so the many dict lookups keyed by subject and group compare by identity
+        subject = sys.intern(entry.get("codi_assig"))
+        group_key = sys.intern(str(entry.get("grup")))
         class_entries = extract_class_info(entry)
         if not class_entries:
             continue
@@ -7,7 +7,7 @@ Optimized for performance with:
 - Set-based conflict detection
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 from app.core.constants import LANGUAGE_MAPPING, DEFAULT_LANGUAGE, SORT_MODE_GROUPS, SORT_MODE_DEAD_HOURS
 from app.api import fetch_classes_data
@@ -32,6 +32,7 @@ def get_schedule_combinations(
     max_dead_hours: int = -1,
     show_progress: bool = False,
     sort_mode: str = SORT_MODE_GROUPS,
+    parsed_schedule: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
     Get valid schedule combinations.
@@ -49,6 +50,8 @@ def get_schedule_combinations(
         max_dead_hours: Maximum allowed dead hours (-1 for no limit)
         show_progress: Whether to show a progress bar
         sort_mode: Sort mode for schedules ("groups" or "dead_hours")
+        parsed_schedule: Already parsed English class data of the quadrimester,
+            fetched when not given
     
     Returns:
         Dictionary containing the schedule combinations
@@ -63,8 +66,9 @@ def get_schedule_combinations(
     # Clear cache before new search to avoid stale data
     clear_cache()
 
-    raw_data = fetch_classes_data(quadrimester, display_language)
-    parsed_schedule = parse_classes_data(raw_data)
+    if parsed_schedule is None:
+        raw_data = fetch_classes_data(quadrimester, display_language)
+        parsed_schedule = parse_classes_data(raw_data)
     group_schedule, subgroup_schedule = split_schedule_by_group_type(parsed_schedule)
     valid_group_combos = get_valid_combinations(group_schedule, subjects, blacklist, allowed_languages, start_hour, end_hour)
     valid_subgroup_combos = get_valid_combinations(subgroup_schedule, subjects, blacklist, allowed_languages, start_hour, end_hour)
@@ -8,23 +8,60 @@ import time
 import shutil
 import threading
 from datetime import date
+from functools import lru_cache
 
 # Import msvcrt only on Windows
 try:
     import msvcrt
 except ImportError:
     msvcrt = None
-from typing import Dict, List, Any
-from rich.console import Console
-from rich.text import Text
+from typing import Dict, List, Any, Optional
 
 from app.core.constants import FILLED_BAR_COLOR, EMPTY_BAR_COLOR, TEXT_COLOR, NUMBER_COLOR, LANGUAGE_MAP
 
-console = Console()
+# Clear screen, clear scrollback and move the cursor home
+CLEAR_SCREEN_SEQUENCE = "\033[2J\033[3J\033[H"
+
+# Whether stdout understands ANSI escape sequences, checked on first use
+_ansi_supported: Optional[bool] = None
+
+
+def enable_ansi_sequences() -> bool:
+    """
+    Enable ANSI escape sequence processing for the terminal if needed.
+    
+    Windows 10+ consoles support them once virtual terminal processing is
+    switched on; other platforms support them out of the box.
+    
+    Returns:
+        True if escape sequences written to stdout are interpreted
+    """
+    if os.name != "nt":
+        return True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, OSError):
+        return False
+
 
 def clear_screen() -> None:
     """Clear the terminal screen."""
-    os.system("cls" if os.name == "nt" else "clear")
+    global _ansi_supported
+    if _ansi_supported is None:
+        _ansi_supported = sys.stdout.isatty() and enable_ansi_sequences()
+    if _ansi_supported:
+        # A single write instead of spawning a cls/clear process
+        sys.stdout.write(CLEAR_SCREEN_SEQUENCE)
+        sys.stdout.flush()
+    else:
+        os.system("cls" if os.name == "nt" else "clear")
 
 
 def hide_cursor() -> None:
@@ -47,6 +84,32 @@ def is_interactive_mode() -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
+def available_cpu_count() -> int:
+    """
+    Get the number of CPUs this process may actually use.
+    
+    Unlike os.cpu_count, this honours the CPU affinity mask and a cgroup v2
+    CPU quota, so containers limited to a fraction of the host see their
+    own share rather than every host core.
+    
+    Returns:
+        Number of usable CPUs, at least 1
+    """
+    if hasattr(os, "sched_getaffinity"):
+        count = len(os.sched_getaffinity(0))
+    else:
+        count = os.cpu_count() or 1
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()[:2]
+        if quota != "max":
+            count = min(count, -(-int(quota) // int(period)))
+    except (OSError, ValueError):
+        pass
+    return max(count, 1)
+
+
 def get_default_quadrimester() -> str:
     """
     Get the default quadrimester based on the current date.
@@ -59,9 +122,11 @@ def get_default_quadrimester() -> str:
     return f"{today.year-1}Q{half+1}"
 
 
+@lru_cache(maxsize=64)
 def normalize_language(lang: str) -> str:
     """
-    Normalize a language name to its code.
+    Normalize a language name to its code. Results are cached, as the same
+    few language strings are normalized for every class entry.
     
     Args:
         lang: Language name or code
@@ -127,36 +192,20 @@ def parse_whitelist(whitelist_items: list[str]) -> list[list[str, int]]:
     return parsed
 
 
-def is_whitelist_satisfied(schedule_subjects: dict, whitelist: list[list]) -> bool:
+@lru_cache(maxsize=1)
+def _progress_console() -> Any:
     """
-    Check if a schedule satisfies all whitelist requirements.
-    
-    A schedule satisfies the whitelist if it contains ALL whitelisted groups.
+    Create the console used by the progress bar on first use.
     
-    Args:
-        schedule_subjects: Dictionary mapping subject codes to group information
-                          e.g., {'PROP': {'group': 10, 'subgroup': 11}, ...}
-        whitelist: List of [subject, group] pairs that must be included
+    Rich is imported here rather than at module level so that the web server,
+    which imports this module but never draws a terminal progress bar, does
+    not pay for loading it.
     
     Returns:
-        True if all whitelisted groups are present, False otherwise
+        Rich Console object
     """
-    if not whitelist:
-        return True
-    
-    for subject, group in whitelist:
-        subject_info = schedule_subjects.get(subject)
-        if not subject_info:
-            return False
-        
-        # Check if the whitelisted group matches either the group or subgroup
-        schedule_group = subject_info.get('group')
-        schedule_subgroup = subject_info.get('subgroup')
-        
-        if schedule_group != group and schedule_subgroup != group:
-            return False
-    
-    return True
+    from rich.console import Console
+    return Console()
 
 
 def update_terminal_progress(count: int, total: int) -> None:
@@ -180,9 +229,11 @@ def update_terminal_progress(count: int, total: int) -> None:
     update_terminal_progress.last_time = now
 
     if not hasattr(update_terminal_progress, "position_set"):
-        os.system("cls" if os.name == "nt" else "clear")
+        clear_screen()
     print("\033[?25l", end="", flush=True)
     
+    from rich.text import Text
+    
     size = shutil.get_terminal_size()
     bar_width = min(50, max(size.columns - 10, 10))
     filled = int(bar_width * count / total) if total else bar_width
@@ -197,6 +248,7 @@ def update_terminal_progress(count: int, total: int) -> None:
     else:
         print("\033[2A", end="")
 
+    console = _progress_console()
     print("\033[2K", end="")  # clear line
     console.print(bar, justify="center")
     print("\033[2K", end="")
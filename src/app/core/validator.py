@@ -2,22 +2,27 @@
 Module for validating schedules and generating valid combinations.
 
 Optimized version with:
-- Precomputed slot sets for O(1) conflict detection
+- Precomputed slot bitmasks for O(1) conflict and day checks
 - Early pruning during combination generation
 - Set-based operations for fast membership tests
 - Lazy evaluation with generators
 - Caching of computed values
 """
 
-import itertools
 import logging
+import os
 import sys
 import threading
+from concurrent.futures import ProcessPoolExecutor
 from functools import lru_cache
-from typing import Dict, List, Tuple, Set, Any, Iterator, FrozenSet, Optional
+from operator import itemgetter
+from typing import (Dict, List, Tuple, Set, Any, Iterable, Iterator, FrozenSet,
+                    Optional, Sequence)
 
 from app.api import generate_schedule_url
-from app.core.utils import run_progress_thread, is_whitelist_satisfied
+from app.core.utils import available_cpu_count, run_progress_thread
+from app.core.constants import MERGE_WORKERS_ENV
+from app.core.validator_kernel import filter_pairs, numba_available
 
 # Initialize module logger
 logger = logging.getLogger(__name__)
@@ -26,6 +31,27 @@ logger = logging.getLogger(__name__)
 Slot = Tuple[int, int]  # (day, hour)
 SlotSet = FrozenSet[Slot]
 
+# Slot bitmasks: bit (day * SLOTS_PER_DAY + hour) is set for every occupied
+# slot, so conflicts, unions and per-day extraction are plain int operations
+SLOTS_PER_DAY = 24
+DAY_SLOTS_MASK = (1 << SLOTS_PER_DAY) - 1
+
+# Read-only data shared by every merge chunk: group/subgroup combinations
+# with their group numbers already parsed, their aggregate slot and day
+# masks (parallel to the combination lists), the require-matching map, the
+# per group combination whitelist residuals and the filters
+WhitelistResidual = Optional[Tuple[Tuple[str, int], ...]]
+ComboValues = Dict[str, int]  # subject -> parsed group number
+MergeState = Tuple[List[ComboValues], List[ComboValues],
+                   List[int], List[int], List[int], List[int],
+                   Optional[Dict[int, List[int]]], List[int], Optional[List[WhitelistResidual]],
+                   int, int, str]
+
+# Minimum number of (group, subgroup) pairs before merging is handed to the
+# Numba kernel or spread across worker processes; below this the JIT/pool
+# startup cost outweighs the gain.
+PARALLEL_PAIR_THRESHOLD = 1_000_000
+
 class SlotCache:
     """Cache for precomputed slot information to avoid redundant calculations.
     
@@ -33,25 +59,24 @@ class SlotCache:
     instead of recomputing for every combination check.
     """
     
-    def __init__(self):
+    def __init__(self) -> None:
         self._group_slots: Dict[Tuple[str, str], SlotSet] = {}
         self._group_hours: Dict[Tuple[str, str], FrozenSet[int]] = {}
         self._group_days: Dict[Tuple[str, str], FrozenSet[int]] = {}
-        self._dead_hours_cache: Dict[SlotSet, int] = {}
+        self._group_masks: Dict[Tuple[str, str], int] = {}
+        self._group_day_masks: Dict[Tuple[str, str], int] = {}
+        self._dead_hours_cache: Dict[int, int] = {}
     
     def precompute_slots(self, schedule: Dict[str, Any]) -> None:
         """Precompute all slot sets for a schedule."""
-        for subject, groups in schedule.items():
-            for group_id, classes in groups.items():
-                if not isinstance(classes, list):
-                    continue
+        for subject, groups in precompute_subject_slots(schedule).items():
+            for group_id, group_slots in groups.items():
                 key = (subject, group_id)
-                slots = frozenset((entry["day"], entry["hour"]) for entry in classes)
-                hours = frozenset(entry["hour"] for entry in classes)
-                days = frozenset(entry["day"] for entry in classes)
-                self._group_slots[key] = slots
-                self._group_hours[key] = hours
-                self._group_days[key] = days
+                self._group_slots[key] = frozenset(group_slots)
+                self._group_hours[key] = frozenset(hour for _, hour in group_slots)
+                self._group_days[key] = frozenset(day for day, _ in group_slots)
+                self._group_masks[key] = get_slot_mask(group_slots)
+                self._group_day_masks[key] = get_day_mask(group_slots)
     
     def get_slots(self, subject: str, group: str) -> SlotSet:
         """Get cached slot set for a subject/group combination."""
@@ -65,6 +90,14 @@ class SlotCache:
         """Get cached days set for a subject/group combination."""
         return self._group_days.get((subject, group), frozenset())
     
+    def get_mask(self, subject: str, group: str) -> int:
+        """Get cached slot bitmask for a subject/group combination."""
+        return self._group_masks.get((subject, group), 0)
+    
+    def get_day_mask(self, subject: str, group: str) -> int:
+        """Get cached bitmask of days with classes for a subject/group combination."""
+        return self._group_day_masks.get((subject, group), 0)
+    
     def get_combo_slots(self, schedule: Dict[str, Any], combination: Dict[str, Any]) -> SlotSet:
         """Get combined slot set for a combination, using cache."""
         all_slots: Set[Slot] = set()
@@ -76,13 +109,13 @@ class SlotCache:
         """Fast conflict detection using set intersection."""
         return bool(slots1 & slots2)
     
-    def get_dead_hours_cached(self, slots: SlotSet) -> int:
-        """Calculate dead hours with caching."""
-        if slots in self._dead_hours_cache:
-            return self._dead_hours_cache[slots]
+    def get_dead_hours_cached(self, mask: int) -> int:
+        """Calculate dead hours of a slot bitmask with caching."""
+        if mask in self._dead_hours_cache:
+            return self._dead_hours_cache[mask]
         
-        dead_hours = _calculate_dead_hours_from_slots(slots)
-        self._dead_hours_cache[slots] = dead_hours
+        dead_hours = _calculate_dead_hours_from_mask(mask)
+        self._dead_hours_cache[mask] = dead_hours
         return dead_hours
 
 
@@ -91,13 +124,79 @@ _slot_cache = SlotCache()
 
 
 def clear_cache() -> None:
-    """Clear the global slot cache.
+    """Clear the global slot cache and the schedule URL cache.
     
     Call this between independent schedule searches to free memory
     and avoid stale data issues.
     """
     global _slot_cache
     _slot_cache = SlotCache()
+    _cached_schedule_url.cache_clear()
+
+
+def precompute_subject_slots(schedule: Dict[str, Any]) -> Dict[str, Dict[str, Tuple[Slot, ...]]]:
+    """
+    Precompute the (day, hour) slots of every group of every subject.
+    
+    Args:
+        schedule: Dictionary containing parsed class data
+    
+    Returns:
+        Dictionary mapping subjects to dictionaries mapping group ids to slot tuples
+    """
+    return {
+        subject: {
+            group_id: tuple((entry["day"], entry["hour"]) for entry in classes)
+            for group_id, classes in groups.items()
+            if isinstance(classes, list)
+        }
+        for subject, groups in schedule.items()
+    }
+
+
+def get_slot_mask(slots: Iterable[Slot]) -> int:
+    """
+    Encode (day, hour) slots as a bitmask.
+    
+    Args:
+        slots: Iterable of (day, hour) slots
+    
+    Returns:
+        Integer with bit (day * SLOTS_PER_DAY + hour) set for every slot
+    """
+    mask = 0
+    for day, hour in slots:
+        mask |= 1 << (day * SLOTS_PER_DAY + hour)
+    return mask
+
+
+def get_day_mask(slots: Iterable[Slot]) -> int:
+    """
+    Encode the days of (day, hour) slots as a bitmask.
+    
+    Args:
+        slots: Iterable of (day, hour) slots
+    
+    Returns:
+        Integer with bit (day) set for every day with at least one slot
+    """
+    mask = 0
+    for day, _ in slots:
+        mask |= 1 << day
+    return mask
+
+
+def _calculate_dead_hours_from_mask(mask: int) -> int:
+    """Calculate dead hours from a slot bitmask, one day-sized chunk at a time."""
+    dead_hours = 0
+    while mask:
+        day_bits = mask & DAY_SLOTS_MASK
+        if day_bits:
+            first = (day_bits & -day_bits).bit_length() - 1
+            last = day_bits.bit_length() - 1
+            dead_hours += (last - first + 1) - bin(day_bits).count("1")
+        mask >>= SLOTS_PER_DAY
+    return dead_hours
 
 
 def _calculate_dead_hours_from_slots(slots: SlotSet) -> int:
@@ -105,20 +204,21 @@ def _calculate_dead_hours_from_slots(slots: SlotSet) -> int:
     if not slots:
         return 0
     
-    # Group by day
-    days_hours: Dict[int, List[int]] = {}
+    # Track [min_hour, max_hour, count] per day in a single pass (no sorting)
+    days_stats: Dict[int, List[int]] = {}
     for day, hour in slots:
-        days_hours.setdefault(day, []).append(hour)
-    
-    dead_hours = 0
-    for day, hours in days_hours.items():
-        if len(hours) < 2:
-            continue
-        hours_sorted = sorted(hours)
-        span = hours_sorted[-1] - hours_sorted[0] + 1
-        dead_hours += span - len(hours)
-    
-    return dead_hours
+        stats = days_stats.get(day)
+        if stats is None:
+            days_stats[day] = [hour, hour, 1]
+        else:
+            if hour < stats[0]:
+                stats[0] = hour
+            if hour > stats[1]:
+                stats[1] = hour
+            stats[2] += 1
+    
+    return sum((stats[1] - stats[0] + 1) - stats[2]
+               for stats in days_stats.values() if stats[2] >= 2)
 
 
 def get_time_slots(schedule: Dict[str, Any], combination: Dict[str, Any]) -> Dict[Tuple[int, int], List[str]]:
@@ -132,7 +232,7 @@ def get_time_slots(schedule: Dict[str, Any], combination: Dict[str, Any]) -> Dic
     Returns:
         Dictionary mapping (day, hour) slots to lists of subjects
     """
-    slots = {}
+    slots: Dict[Tuple[int, int], List[str]] = {}
     for subject, group in combination.items():
         for entry in schedule.get(subject, {}).get(str(group), []):
             slot = (entry["day"], entry["hour"])
@@ -158,7 +258,8 @@ def count_dead_hours(slots: Dict[Tuple[int, int], List[str]]) -> int:
     Count the number of dead hours in a schedule.
     A dead hour is an hour without classes between two hours with classes on the same day.
     
-    Optimized version using set operations for faster computation.
+    Each day's occupied hours are kept as a bitmap, so the gaps are the
+    unset bits between its lowest and highest set bit.
     
     Args:
         slots: Dictionary mapping (day, hour) slots to lists of subjects
@@ -169,23 +270,17 @@ def count_dead_hours(slots: Dict[Tuple[int, int], List[str]]) -> int:
     if not slots:
         return 0
     
-    # Group slots by day using a dict
-    days_hours: Dict[int, List[int]] = {}
+    day_hour_masks: Dict[int, int] = {}
     for (day, hour), subjects in slots.items():
         if subjects:  # Only count hours with actual classes
-            days_hours.setdefault(day, []).append(hour)
+            day_hour_masks[day] = day_hour_masks.get(day, 0) | (1 << hour)
     
     dead_hours = 0
-    for hours in days_hours.values():
-        if len(hours) < 2:
-            continue
-        # Optimized: use min/max and set membership instead of sorting
-        hours_set = set(hours)
-        first_class = min(hours)
-        last_class = max(hours)
-        # Count gaps using range and set difference
-        expected_count = last_class - first_class + 1
-        dead_hours += expected_count - len(hours_set)
+    for mask in day_hour_masks.values():
+        first = (mask & -mask).bit_length() - 1
+        last = mask.bit_length() - 1
+        span = (1 << (last + 1)) - (1 << first)
+        dead_hours += bin(span & ~mask).count("1")
     
     return dead_hours
 
@@ -224,6 +319,55 @@ def is_language_compatible(class_language: str, allowed_languages: List[str]) ->
     return any(lang.lower() in class_language for lang in allowed_languages)
 
 
+def get_language_compatibility(schedule: Dict[str, Any],
+                               subjects: Iterable[str],
+                               allowed_languages: List[str]) -> Dict[str, Dict[str, bool]]:
+    """
+    Precompute whether every class of each subject group is in an allowed language.
+    
+    Each distinct language string is checked only once.
+    
+    Args:
+        schedule: Dictionary containing parsed class data
+        subjects: Subject codes to precompute
+        allowed_languages: List of allowed languages
+    
+    Returns:
+        Dictionary mapping subjects to dictionaries mapping group ids to booleans
+    """
+    compatible: Dict[str, bool] = {}
+    language_ok: Dict[str, Dict[str, bool]] = {}
+    for subject in subjects:
+        subject_ok = language_ok.setdefault(subject, {})
+        for group_id, classes in schedule.get(subject, {}).items():
+            if not isinstance(classes, list):
+                continue
+            group_ok = True
+            for entry in classes:
+                lang = entry.get("language", "")
+                lang_ok = compatible.get(lang)
+                if lang_ok is None:
+                    lang_ok = compatible[lang] = is_language_compatible(lang, allowed_languages)
+                if not lang_ok:
+                    group_ok = False
+                    break
+            subject_ok[group_id] = group_ok
+    return language_ok
+
+
+def get_blacklist_set(blacklist: List[List[Any]]) -> FrozenSet[Tuple[str, int]]:
+    """
+    Convert a blacklist into a frozenset for O(1) membership checks.
+    
+    Args:
+        blacklist: List of [subject, group] pairs
+    
+    Returns:
+        Frozenset of (subject, group) tuples
+    """
+    return frozenset((item[0], int(item[1])) for item in blacklist)
+
+
 def is_group_blacklisted(subject: str, group: str, blacklist: List[List[Any]]) -> bool:
     """
     Check if a group is blacklisted.
@@ -245,7 +389,8 @@ def is_valid_schedule(schedule: Dict[str, Any],
                       allowed_languages: List[str],
                       start_hour: int,
                       end_hour: int,
-                      blacklist_set: Optional[FrozenSet[Tuple[str, int]]] = None) -> bool:
+                      blacklist_set: Optional[FrozenSet[Tuple[str, int]]] = None,
+                      language_ok: Optional[Dict[str, Dict[str, bool]]] = None) -> bool:
     """
     Check if a schedule is valid.
     
@@ -262,13 +407,15 @@ def is_valid_schedule(schedule: Dict[str, Any],
         start_hour: Minimum allowed hour
         end_hour: Maximum allowed hour
         blacklist_set: Pre-computed frozenset for faster blacklist checks
+        language_ok: Pre-computed result of get_language_compatibility covering
+                     the combination's subjects, replacing the per-class language check
     
     Returns:
         True if the schedule is valid, False otherwise
     """
     # Use pre-computed blacklist set if available, otherwise compute
     if blacklist_set is None:
-        blacklist_set = frozenset((item[0], int(item[1])) for item in blacklist)
+        blacklist_set = get_blacklist_set(blacklist)
     
     used_slots: Set[Tuple[int, int]] = set()
     min_hour = float('inf')
@@ -280,10 +427,17 @@ def is_valid_schedule(schedule: Dict[str, Any],
         if (subject, group_int) in blacklist_set:
             return False
         
-        entries = schedule.get(subject, {}).get(str(group), [])
+        group_key = str(group)
+        check_language = bool(allowed_languages)
+        if language_ok is not None:
+            if not language_ok[subject][group_key]:
+                return False
+            check_language = False
+        
+        entries = schedule.get(subject, {}).get(group_key, [])
         for entry in entries:
             # Early language check
-            if allowed_languages:
+            if check_language:
                 lang = entry.get("language", "")
                 if lang and not any(al.lower() in lang.lower() for al in allowed_languages):
                     return False
@@ -358,17 +512,24 @@ def has_valid_combined_schedule(group_slots: Dict[Tuple[int, int], List[str]],
     Returns:
         True if the combined schedule is valid, False otherwise
     """
-    # Merge slots from both groups
-    all_slots = {slot: subjects[:] for slot, subjects in group_slots.items()}
-    for slot, subjects in subgroup_slots.items():
-        all_slots.setdefault(slot, []).extend(subjects)
-    if has_schedule_conflicts(all_slots):
-        return False
-    if count_days_with_classes(group_slots, subgroup_slots) > max_days:
+    # Single pass over both inputs: reject on the first conflict while
+    # collecting the days and hours, without building merged slots
+    days: Set[int] = set()
+    hours: Set[int] = set()
+    for (day, hour), subjects in group_slots.items():
+        if len(subjects) > 1:
+            return False
+        days.add(day)
+        hours.add(hour)
+    for (day, hour), subjects in subgroup_slots.items():
+        if len(subjects) > 1 or (subjects and group_slots.get((day, hour))):
+            return False
+        days.add(day)
+        hours.add(hour)
+    if len(days) > max_days:
         return False
     if has_excessive_dead_hours(group_slots, subgroup_slots, max_dead_hours):
         return False
-    hours = {hour for _, hour in all_slots.keys()} if all_slots else set()
     return is_within_time_bounds(hours, start_hour, end_hour)
 
 
@@ -389,6 +550,36 @@ def are_groups_matching(group_combo: Dict[str, str], subgroup_combo: Dict[str, s
     )
 
 
+def get_whitelist_residual(group_combo: Dict[str, str],
+                           whitelist: List[List[Any]]) -> WhitelistResidual:
+    """
+    Get the whitelist requirements left for the subgroups once a group combination is fixed.
+    
+    A whitelisted group is satisfied when it matches either the group or the
+    subgroup of its subject, so entries already matched by the group combination
+    are dropped and the rest must be matched by the subgroup.
+    
+    Args:
+        group_combo: Dictionary mapping subjects to groups
+        whitelist: List of [subject, group] pairs that must be included
+    
+    Returns:
+        Tuple of (subject, group) pairs the subgroup must match, or None if no
+        subgroup combination can satisfy the whitelist
+    """
+    residual: Dict[str, int] = {}
+    for subject, group in whitelist:
+        if subject not in group_combo:
+            return None
+        group = int(group)
+        if int(group_combo[subject]) == group:
+            continue
+        # A subject has a single subgroup, so two different requirements can't both hold
+        if residual.setdefault(subject, group) != group:
+            return None
+    return tuple(residual.items())
+
+
 def create_schedule_subjects(group_combo: Dict[str, str],
                              subgroup_combo: Dict[str, str]) -> Dict[str, Dict[str, int]]:
     """
@@ -423,6 +614,7 @@ def get_valid_combinations(schedule: Dict[str, Dict[str, List[Dict[str, Any]]]],
     - Pre-filtering of invalid groups before combination generation
     - Precomputed blacklist set for O(1) lookup
     - Reduced combination space through early constraint application
+    - Backtracking search that cuts conflicting branches of the product
     
     Args:
         schedule: Dictionary containing parsed class data
@@ -436,7 +628,10 @@ def get_valid_combinations(schedule: Dict[str, Dict[str, List[Dict[str, Any]]]],
         List of valid schedule combinations
     """
     # Precompute blacklist set for O(1) lookups
-    blacklist_set = frozenset((item[0], int(item[1])) for item in blacklist)
+    blacklist_set = get_blacklist_set(blacklist)
+    
+    # Language compatibility is fixed for the whole search, so evaluate it once per group
+    language_ok = get_language_compatibility(schedule, subjects, allowed_languages)
     
     # Pre-filter valid groups per subject before generating combinations
     # This dramatically reduces the combination space
@@ -455,22 +650,12 @@ def get_valid_combinations(schedule: Dict[str, Dict[str, List[Dict[str, Any]]]],
             if (subject, int(group_id)) in blacklist_set:
                 continue
             
-            # Check if group passes basic constraints
-            is_valid = True
-            for entry in classes:
-                hour = entry.get("hour", 0)
-                # Time bounds check
-                if hour < start_hour or hour > end_hour:
-                    is_valid = False
-                    break
-                # Language check
-                if allowed_languages:
-                    lang = entry.get("language", "")
-                    if lang and not any(al.lower() in lang.lower() for al in allowed_languages):
-                        is_valid = False
-                        break
+            # Language check
+            if not language_ok[subject][group_id]:
+                continue
             
-            if is_valid:
+            # Time bounds check
+            if all(start_hour <= entry.get("hour", 0) <= end_hour for entry in classes):
                 valid_groups.append(group_id)
         
         if valid_groups:
@@ -483,30 +668,34 @@ def get_valid_combinations(schedule: Dict[str, Dict[str, List[Dict[str, Any]]]],
     # Precompute slot cache for conflict detection
     _slot_cache.precompute_slots(schedule)
     
-    # Generate combinations only from valid groups
-    valid = []
+    # Generate combinations only from valid groups, pruning every branch
+    # as soon as a group conflicts with the groups already chosen
     subjects_ordered = list(valid_groups_per_subject.keys())
     group_lists = [valid_groups_per_subject[s] for s in subjects_ordered]
+    mask_lists = [[_slot_cache.get_mask(s, group) for group in valid_groups_per_subject[s]]
+                  for s in subjects_ordered]
     
-    for combo_tuple in itertools.product(*group_lists):
-        combo = dict(zip(subjects_ordered, combo_tuple))
-        
-        # Fast conflict check using precomputed slots
-        all_slots: Set[Tuple[int, int]] = set()
-        has_conflict = False
-        
-        for subject, group in combo.items():
-            group_slots = _slot_cache.get_slots(subject, group)
-            # Check for conflicts with already added slots
-            if all_slots & group_slots:
-                has_conflict = True
-                break
-            all_slots.update(group_slots)
-        
-        if not has_conflict:
-            valid.append(combo)
+    return list(_iter_conflict_free_combinations(subjects_ordered, group_lists, mask_lists))
+
+
+def _iter_conflict_free_combinations(subjects: List[str],
+                                     group_lists: List[List[str]],
+                                     mask_lists: List[List[int]]) -> Iterator[Dict[str, str]]:
+    """Yield conflict-free combinations depth first, in itertools.product order."""
+    chosen: List[str] = []
+    
+    def search(index: int, used_mask: int) -> Iterator[Dict[str, str]]:
+        if index == len(subjects):
+            yield dict(zip(subjects, chosen))
+            return
+        for group, mask in zip(group_lists[index], mask_lists[index]):
+            if used_mask & mask:
+                continue
+            chosen.append(group)
+            yield from search(index + 1, used_mask | mask)
+            chosen.pop()
     
-    return valid
+    return search(0, 0)
 
 
 def merge_valid_schedules(group_combos: List[Dict[str, str]],
@@ -519,17 +708,18 @@ def merge_valid_schedules(group_combos: List[Dict[str, str]],
                           require_matching: bool,
                           quadrimester: str,
                           max_dead_hours: int = -1,
-                          whitelist: List[List[Any]] = None,
+                          whitelist: Optional[List[List[Any]]] = None,
                           show_progress: bool = False
                           ) -> Tuple[List[Dict[str, Any]], List[str]]:
     """
     Merge valid group and subgroup schedules.
     
     Optimized version with:
-    - Precomputed slot sets for fast conflict detection
+    - Precomputed per-combination slot and day bitmasks
     - Early matching check before expensive slot computation
-    - Cached slot sets avoid redundant computation
-    - Fast set-based operations for conflict and day checks
+    - Bitwise conflict and day checks per pair
+    - Large searches split by group combination across worker processes
+      (threads would not help, as the pair loop holds the GIL throughout)
     
     Args:
         group_combos: List of valid group combinations
@@ -548,48 +738,25 @@ def merge_valid_schedules(group_combos: List[Dict[str, str]],
     Returns:
         Tuple of (merged_schedules, urls)
     """
-    merged_schedules = []
-    urls = []
+    merged_schedules: List[Dict[str, Any]] = []
+    urls: List[str] = []
     
     # Precompute slots for both schedules
     _slot_cache.precompute_slots(group_schedule)
     _slot_cache.precompute_slots(subgroup_schedule)
     
-    # Precompute slot sets for all group combinations (avoid redundant computation)
-    group_combo_slots: Dict[int, Tuple[SlotSet, FrozenSet[int]]] = {}
-    for i, combo in enumerate(group_combos):
-        slots: Set[Slot] = set()
-        days: Set[int] = set()
-        for subject, group in combo.items():
-            group_slots = _slot_cache.get_slots(subject, group)
-            group_days = _slot_cache.get_days(subject, group)
-            slots.update(group_slots)
-            days.update(group_days)
-        group_combo_slots[i] = (frozenset(slots), frozenset(days))
-    
-    # Precompute slot sets for all subgroup combinations
-    subgroup_combo_slots: Dict[int, Tuple[SlotSet, FrozenSet[int]]] = {}
-    for i, combo in enumerate(subgroup_combos):
-        slots: Set[Slot] = set()
-        days: Set[int] = set()
-        for subject, group in combo.items():
-            sub_slots = _slot_cache.get_slots(subject, group)
-            sub_days = _slot_cache.get_days(subject, group)
-            slots.update(sub_slots)
-            days.update(sub_days)
-        subgroup_combo_slots[i] = (frozenset(slots), frozenset(days))
+    # Aggregate slot and day bitmasks once per combination (O(N + M)), so the
+    # O(N * M) pair loop below is reduced to a few int operations per pair
+    group_masks, group_day_masks = _get_combo_masks(group_combos)
+    subgroup_masks, subgroup_day_masks = _get_combo_masks(subgroup_combos)
     
     # If require_matching, precompute matching map to avoid redundant checks
     matching_subgroups: Optional[Dict[int, List[int]]] = None
     if require_matching:
-        matching_subgroups = {}
-        for gi, group_combo in enumerate(group_combos):
-            matching = []
-            for si, subgroup_combo in enumerate(subgroup_combos):
-                if are_groups_matching(group_combo, subgroup_combo):
-                    matching.append(si)
-            matching_subgroups[gi] = matching
+        matching_subgroups = _get_matching_subgroups(group_combos, subgroup_combos)
     
+    # Progress counts every (group, subgroup) pair of a processed row, also
+    # those skipped by require_matching or a failed row check, in all paths
     total_iters = max(len(group_combos) * len(subgroup_combos), 1)
     progress = {"count": 0, "total": total_iters, "done": False}
     thread = None
@@ -597,52 +764,350 @@ def merge_valid_schedules(group_combos: List[Dict[str, str]],
         thread = threading.Thread(target=run_progress_thread, args=(progress,), daemon=True)
         thread.start()
     
-    for gi, group_combo in enumerate(group_combos):
-        g_slots, g_days = group_combo_slots[gi]
+    # Resolve the whitelist per group combination once, outside the pair loop
+    whitelist_residuals: Optional[List[WhitelistResidual]] = None
+    if whitelist:
+        whitelist_residuals = [get_whitelist_residual(combo, whitelist) for combo in group_combos]
+    
+    # Group combinations sharing a slot mask and candidate subgroups pass
+    # exactly the same subgroups, so each such class is only checked once
+    group_classes = _get_group_classes(group_masks, matching_subgroups)
+    
+    # Parse every group number once, so no int() runs for surviving pairs
+    merge_state: MergeState = (
+        _get_combo_values(group_combos), _get_combo_values(subgroup_combos),
+        group_masks, group_day_masks, subgroup_masks, subgroup_day_masks,
+        matching_subgroups, group_classes, whitelist_residuals, max_days, max_dead_hours, quadrimester
+    )
+    
+    # Caps both the worker processes and the Numba kernel's threads
+    workers = int(os.environ.get(MERGE_WORKERS_ENV, 0)) or available_cpu_count()
+    large_search = len(group_combos) * len(subgroup_combos) > PARALLEL_PAIR_THRESHOLD
+    if large_search and numba_available():
+        merged_schedules, urls = _merge_with_kernel(merge_state, workers)
+        progress["count"] += len(group_combos) * len(subgroup_combos)
+    elif large_search and workers > 1:
+        # Contiguous chunks keep the output order identical to the sequential path
+        chunk_size = -(-len(group_combos) // (workers * 4))
+        chunks = [range(i, min(i + chunk_size, len(group_combos)))
+                  for i in range(0, len(group_combos), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_merge_worker,
+                                 initargs=(merge_state,)) as executor:
+            for chunk, (chunk_schedules, chunk_urls) in zip(chunks, executor.map(_merge_worker_chunk, chunks)):
+                merged_schedules.extend(chunk_schedules)
+                urls.extend(chunk_urls)
+                progress["count"] += len(chunk) * len(subgroup_combos)
+    else:
+        merged_schedules, urls = _merge_chunk(range(len(group_combos)), merge_state, progress)
+    
+    if thread:
+        progress["done"] = True
+        thread.join()
+    
+    return merged_schedules, urls
+
+
+def _get_combo_values(combos: List[Dict[str, str]]) -> List[ComboValues]:
+    """Parse the group numbers of every combination, each distinct string once."""
+    parsed: Dict[str, int] = {}
+    combo_values = []
+    for combo in combos:
+        values = {}
+        for subject, group in combo.items():
+            value = parsed.get(group)
+            if value is None:
+                value = parsed[group] = int(group)
+            values[subject] = value
+        combo_values.append(values)
+    return combo_values
+
+
+def _get_combo_masks(combos: List[Dict[str, str]]) -> Tuple[List[int], List[int]]:
+    """
+    Aggregate the cached slot and day bitmasks of every combination.
+    
+    Args:
+        combos: List of combinations mapping subjects to groups
+    
+    Returns:
+        Tuple of (slot_masks, day_masks), parallel to combos
+    """
+    slot_masks = []
+    day_masks = []
+    for combo in combos:
+        slot_mask = 0
+        day_mask = 0
+        for subject, group in combo.items():
+            slot_mask |= _slot_cache.get_mask(subject, group)
+            day_mask |= _slot_cache.get_day_mask(subject, group)
+        slot_masks.append(slot_mask)
+        day_masks.append(day_mask)
+    return slot_masks, day_masks
+
+
+def _get_matching_subgroups(group_combos: List[Dict[str, str]],
+                            subgroup_combos: List[Dict[str, str]]) -> Dict[int, List[int]]:
+    """
+    Find the subgroup combinations matching each group combination.
+    
+    Every combination is reduced once to a signature of group tens digits
+    over the subjects the subgroup combinations cover, so matching becomes
+    a dictionary lookup instead of an are_groups_matching call per pair.
+    
+    Args:
+        group_combos: List of valid group combinations
+        subgroup_combos: List of valid subgroup combinations
+    
+    Returns:
+        Dictionary mapping group combination indices to matching subgroup indices
+    """
+    subjects = tuple(subgroup_combos[0]) if subgroup_combos else ()
+    if (any(tuple(combo) != subjects for combo in subgroup_combos)
+            or any(not set(subjects) <= combo.keys() for combo in group_combos)):
+        # Combinations over differing subjects: fall back to pairwise checks
+        return {
+            gi: [si for si, subgroup_combo in enumerate(subgroup_combos)
+                 if are_groups_matching(group_combo, subgroup_combo)]
+            for gi, group_combo in enumerate(group_combos)
+        }
+    
+    tens: Dict[str, int] = {}
+    
+    def signature(combo: Dict[str, str]) -> Tuple[int, ...]:
+        digits = []
+        for subject in subjects:
+            group = combo[subject]
+            digit = tens.get(group)
+            if digit is None:
+                digit = tens[group] = int(group) // 10
+            digits.append(digit)
+        return tuple(digits)
+    
+    subgroups_by_signature: Dict[Tuple[int, ...], List[int]] = {}
+    for si, subgroup_combo in enumerate(subgroup_combos):
+        subgroups_by_signature.setdefault(signature(subgroup_combo), []).append(si)
+    
+    return {gi: subgroups_by_signature.get(signature(group_combo), [])
+            for gi, group_combo in enumerate(group_combos)}
+
+
+def _get_group_classes(group_masks: List[int],
+                       matching_subgroups: Optional[Dict[int, List[int]]]) -> List[int]:
+    """
+    Number the group combinations that are equivalent for the pair checks.
+    
+    Args:
+        group_masks: Slot bitmask per group combination
+        matching_subgroups: Optional candidate subgroup indices per group combination
+    
+    Returns:
+        Class id per group combination; equal ids share slot mask and candidates
+    """
+    class_ids: Dict[Tuple[int, Tuple[int, ...]], int] = {}
+    group_classes = []
+    for gi, mask in enumerate(group_masks):
+        candidates = tuple(matching_subgroups[gi]) if matching_subgroups is not None else ()
+        group_classes.append(class_ids.setdefault((mask, candidates), len(class_ids)))
+    return group_classes
+
+
+def _merge_chunk(group_indices: Iterable[int],
+                 merge_state: MergeState,
+                 progress: Optional[Dict[str, Any]] = None
+                 ) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Merge a range of group combinations against all subgroup combinations.
+    
+    Args:
+        group_indices: Indices into the group combinations to process
+        merge_state: Read-only data shared by every chunk (see merge_valid_schedules)
+        progress: Optional progress dictionary updated per group combination
+    
+    Returns:
+        Tuple of (merged_schedules, urls) for the given chunk
+    """
+    (group_values, subgroup_values,
+     group_masks, group_day_masks, subgroup_masks, subgroup_day_masks,
+     matching_subgroups, group_classes, whitelist_residuals, max_days, max_dead_hours, quadrimester) = merge_state
+    
+    merged_schedules: List[Dict[str, Any]] = []
+    urls: List[str] = []
+    get_dead_hours = _slot_cache.get_dead_hours_cached
+    all_subgroups = range(len(subgroup_values))
+    survivors_by_class: Dict[int, List[int]] = {}
+    
+    # Slots and days shared by every subgroup combination: a group that
+    # conflicts with them, or has too many days with them, fails every pair
+    common_mask = -1
+    common_days = -1
+    for s_mask, s_days in zip(subgroup_masks, subgroup_day_masks):
+        common_mask &= s_mask
+        common_days &= s_days
+    
+    for gi in group_indices:
+        group_combo = group_values[gi]
         
         # Determine which subgroups to check
-        subgroup_indices = matching_subgroups[gi] if matching_subgroups else range(len(subgroup_combos))
+        subgroup_indices: Sequence[int] = matching_subgroups[gi] if matching_subgroups else all_subgroups
         
-        for si in subgroup_indices:
-            progress["count"] += 1
-            subgroup_combo = subgroup_combos[si]
-            s_slots, s_days = subgroup_combo_slots[si]
-            
-            # Fast conflict check using set intersection
-            if g_slots & s_slots:
-                continue
-            
-            # Fast days check
-            combined_days = g_days | s_days
-            if len(combined_days) > max_days:
-                continue
-            
-            # Check dead hours only if there's a limit
-            if max_dead_hours >= 0:
-                combined_slots = g_slots | s_slots
-                dead_hours = _slot_cache.get_dead_hours_cached(combined_slots)
-                if dead_hours > max_dead_hours:
+        # Update progress once per row rather than once per checked pair;
+        # pairs not checked count as processed too, like in the other paths
+        if progress is not None:
+            progress["count"] += len(subgroup_values)
+        
+        # Whitelist: skip the whole row when the groups already rule it out
+        residual = whitelist_residuals[gi] if whitelist_residuals is not None else ()
+        if residual is None:
+            continue
+        
+        survivors = survivors_by_class.get(group_classes[gi])
+        if survivors is None:
+            survivors = []
+            g_mask = group_masks[gi]
+            g_days = group_day_masks[gi]
+            if subgroup_values and (g_mask & common_mask
+                                    or bin(g_days | common_days).count("1") > max_days):
+                subgroup_indices = ()
+            for si in subgroup_indices:
+                s_mask = subgroup_masks[si]
+                
+                # Conflict check: any shared slot bit
+                if g_mask & s_mask:
                     continue
-            
-            # Create schedule entry before whitelist check
-            subjects_entry = create_schedule_subjects(group_combo, subgroup_combo)
-            
-            # Check whitelist - schedule must include ALL whitelisted groups
-            if whitelist and not is_whitelist_satisfied(subjects_entry, whitelist):
-                continue
-            
-            # All checks passed - add schedule entry
-            url = generate_schedule_url(subjects_entry, quadrimester)
-            merged_schedules.append({"subjects": subjects_entry, "url": url})
-            urls.append(url)
+                
+                # Days check: popcount of the combined day bitmask
+                if bin(g_days | subgroup_day_masks[si]).count("1") > max_days:
+                    continue
+                
+                # Check dead hours only if there's a limit
+                if max_dead_hours >= 0 and get_dead_hours(g_mask | s_mask) > max_dead_hours:
+                    continue
+                
+                survivors.append(si)
+            survivors_by_class[group_classes[gi]] = survivors
+        
+        for si in survivors:
+            # Only pairs that passed every mask check get their dicts materialized
+            schedule = _build_schedule_entry(group_combo, subgroup_values[si], residual, quadrimester)
+            if schedule is not None:
+                merged_schedules.append(schedule)
+                urls.append(schedule["url"])
     
-    if thread:
-        progress["done"] = True
-        thread.join()
+    return merged_schedules, urls
+
+
+def _merge_with_kernel(merge_state: MergeState, threads: int) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Merge all combinations using the Numba kernel for the conflict and days checks.
+    
+    Args:
+        merge_state: Read-only merge data (see merge_valid_schedules)
+        threads: Maximum number of kernel threads, the same cap as the process pool
+    
+    Returns:
+        Tuple of (merged_schedules, urls), in the same order as _merge_chunk
+    """
+    (group_values, subgroup_values,
+     group_masks, group_day_masks, subgroup_masks, subgroup_day_masks,
+     matching_subgroups, group_classes, whitelist_residuals, max_days, max_dead_hours, quadrimester) = merge_state
+    
+    # Run the kernel on one representative row per group class
+    representatives: Dict[int, int] = {}
+    for gi, group_class in enumerate(group_classes):
+        representatives.setdefault(group_class, gi)
+    rows = list(representatives.values())
+    
+    candidates = None
+    if matching_subgroups:
+        candidates = [matching_subgroups[gi] for gi in rows]
+    row_indices, subgroup_indices = filter_pairs(
+        [group_masks[gi] for gi in rows], [group_day_masks[gi] for gi in rows],
+        subgroup_masks, subgroup_day_masks, candidates, max_days, threads
+    )
+    
+    get_dead_hours = _slot_cache.get_dead_hours_cached
+    survivors_by_class: Dict[int, List[int]] = {group_class: [] for group_class in representatives}
+    for ri, si in zip(row_indices, subgroup_indices):
+        gi = rows[ri]
+        if max_dead_hours >= 0 and get_dead_hours(group_masks[gi] | subgroup_masks[si]) > max_dead_hours:
+            continue
+        survivors_by_class[group_classes[gi]].append(si)
+    
+    merged_schedules: List[Dict[str, Any]] = []
+    urls: List[str] = []
+    
+    # Only the surviving pairs get the remaining Python-level checks
+    for gi, group_combo in enumerate(group_values):
+        residual = whitelist_residuals[gi] if whitelist_residuals is not None else ()
+        if residual is None:
+            continue
+        for si in survivors_by_class[group_classes[gi]]:
+            schedule = _build_schedule_entry(group_combo, subgroup_values[si], residual, quadrimester)
+            if schedule is not None:
+                merged_schedules.append(schedule)
+                urls.append(schedule["url"])
     
     return merged_schedules, urls
 
 
+def _build_schedule_entry(group_combo: ComboValues,
+                          subgroup_combo: ComboValues,
+                          residual: Tuple[Tuple[str, int], ...],
+                          quadrimester: str) -> Optional[Dict[str, Any]]:
+    """
+    Build the schedule entry for a pair that passed the slot checks.
+    
+    Args:
+        group_combo: Dictionary mapping subjects to parsed groups
+        subgroup_combo: Dictionary mapping subjects to parsed subgroups
+        residual: Whitelisted (subject, group) pairs the subgroups must match
+        quadrimester: Quadrimester code
+    
+    Returns:
+        Schedule dictionary with subjects and URL, or None if the whitelist is not met
+    """
+    # Whitelisted groups not matched by the group must be the subgroup
+    if residual and not all(
+        subgroup_combo.get(subject, group_combo[subject]) == group
+        for subject, group in residual
+    ):
+        return None
+    
+    # Same result as create_schedule_subjects, built together with the URL key
+    subjects_entry = {}
+    url_key = []
+    for subject, group in group_combo.items():
+        subgroup = subgroup_combo.get(subject, group)
+        subjects_entry[subject] = {"group": group, "subgroup": subgroup}
+        url_key.append((subject, group, subgroup))
+    url = _cached_schedule_url(quadrimester, tuple(url_key))
+    return {"subjects": subjects_entry, "url": url}
+
+
+@lru_cache(maxsize=None)
+def _cached_schedule_url(quadrimester: str, url_key: Tuple[Tuple[str, int, int], ...]) -> str:
+    """Generate a schedule URL from an ordered (subject, group, subgroup) key, memoized."""
+    schedule_subjects = {subject: {"group": group, "subgroup": subgroup}
+                         for subject, group, subgroup in url_key}
+    return generate_schedule_url(schedule_subjects, quadrimester)
+
+
+# Merge state installed in each worker process by _init_merge_worker
+_worker_merge_state: Optional[MergeState] = None
+
+
+def _init_merge_worker(merge_state: MergeState) -> None:
+    """Store the shared merge state once per worker process."""
+    global _worker_merge_state
+    _worker_merge_state = merge_state
+
+
+def _merge_worker_chunk(group_indices: range) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Process pool entry point: merge one chunk using the worker's state."""
+    assert _worker_merge_state is not None
+    return _merge_chunk(group_indices, _worker_merge_state)
+
+
 def has_excessive_dead_hours(group_slots: Dict[Tuple[int, int], List[str]],
                              subgroup_slots: Dict[Tuple[int, int], List[str]],
                              max_dead_hours: int) -> bool:
@@ -660,14 +1125,21 @@ def has_excessive_dead_hours(group_slots: Dict[Tuple[int, int], List[str]],
     if max_dead_hours < 0:  # No limit
         return False
     
-    # Merge slots from both groups
-    all_slots = {slot: subjects[:] for slot, subjects in group_slots.items()}
-    for slot, subjects in subgroup_slots.items():
-        all_slots.setdefault(slot, []).extend(subjects)
+    # OR the occupied hours of both schedules into per-day bitmaps
+    day_hour_masks: Dict[int, int] = {}
+    for slots in (group_slots, subgroup_slots):
+        for (day, hour), subjects in slots.items():
+            if subjects:
+                day_hour_masks[day] = day_hour_masks.get(day, 0) | (1 << hour)
     
-    # Count dead hours in the combined schedule
-    dead_hours = count_dead_hours(all_slots)
-    return dead_hours > max_dead_hours
+    dead_hours = 0
+    for mask in day_hour_masks.values():
+        first = (mask & -mask).bit_length() - 1
+        span = (1 << mask.bit_length()) - (1 << first)
+        dead_hours += bin(span & ~mask).count("1")
+        if dead_hours > max_dead_hours:
+            return True
+    return False
 
 
 def calculate_schedule_dead_hours(schedule_subjects: Dict[str, Dict[str, int]],
@@ -684,25 +1156,34 @@ def calculate_schedule_dead_hours(schedule_subjects: Dict[str, Dict[str, int]],
     Returns:
         Total number of dead hours in the schedule
     """
-    all_slots = {}
-    
-    # Add group slots
-    for subject, info in schedule_subjects.items():
-        group = str(info.get("group", ""))
-        if group and subject in group_schedule and group in group_schedule[subject]:
-            for entry in group_schedule[subject][group]:
-                slot = (entry["day"], entry["hour"])
-                all_slots.setdefault(slot, []).append(subject)
-    
-    # Add subgroup slots
+    return _schedule_dead_hours(
+        schedule_subjects,
+        _index_slots_by_number(precompute_subject_slots(
+            {s: group_schedule[s] for s in schedule_subjects if s in group_schedule})),
+        _index_slots_by_number(precompute_subject_slots(
+            {s: subgroup_schedule[s] for s in schedule_subjects if s in subgroup_schedule}))
+    )
+
+
+def _index_slots_by_number(subject_slots: Dict[str, Dict[str, Tuple[Slot, ...]]]
+                           ) -> Dict[str, Dict[int, Tuple[Slot, ...]]]:
+    """Re-key precomputed subject slots by group number, as stored in schedule entries."""
+    return {
+        subject: {int(group_id): slots for group_id, slots in groups.items()
+                  if group_id.isdigit() and str(int(group_id)) == group_id}
+        for subject, groups in subject_slots.items()
+    }
+
+
+def _schedule_dead_hours(schedule_subjects: Dict[str, Dict[str, int]],
+                         group_slots: Dict[str, Dict[int, Tuple[Slot, ...]]],
+                         subgroup_slots: Dict[str, Dict[int, Tuple[Slot, ...]]]) -> int:
+    """Calculate the dead hours of a schedule from slots indexed by group number."""
+    all_slots: Set[Slot] = set()
     for subject, info in schedule_subjects.items():
-        subgroup = str(info.get("subgroup", ""))
-        if subgroup and subject in subgroup_schedule and subgroup in subgroup_schedule[subject]:
-            for entry in subgroup_schedule[subject][subgroup]:
-                slot = (entry["day"], entry["hour"])
-                all_slots.setdefault(slot, []).append(subject)
-    
-    return count_dead_hours(all_slots)
+        all_slots.update(group_slots.get(subject, {}).get(info.get("group", -1), ()))
+        all_slots.update(subgroup_slots.get(subject, {}).get(info.get("subgroup", -1), ()))
+    return _calculate_dead_hours_from_slots(frozenset(all_slots))
 
 
 def calculate_schedule_group_sum(schedule_subjects: Dict[str, Dict[str, int]]) -> int:
@@ -715,19 +1196,22 @@ def calculate_schedule_group_sum(schedule_subjects: Dict[str, Dict[str, int]]) -
     Returns:
         Sum of all group numbers (lower sums indicate lower-numbered groups)
     """
-    total_sum = 0
-    for subject, info in schedule_subjects.items():
-        if info.get("group"):
-            total_sum += info["group"]
-        if info.get("subgroup"):
-            total_sum += info["subgroup"]
-    return total_sum
+    return sum((info.get("group") or 0) + (info.get("subgroup") or 0)
+               for info in schedule_subjects.values())
+
+
+def _schedule_combo_key(schedule_subjects: Dict[str, Dict[str, int]]) -> Tuple[Tuple[str, Any, Any], ...]:
+    """Build a hashable (subject, group, subgroup) key for a schedule's combination."""
+    return tuple(sorted(
+        (subject, info.get("group"), info.get("subgroup"))
+        for subject, info in schedule_subjects.items()
+    ))
 
 
 def sort_schedules_by_mode(schedules: List[Dict[str, Any]], 
                           sort_mode: str,
-                          group_schedule: Dict[str, Dict[str, List[Dict[str, Any]]]] = None,
-                          subgroup_schedule: Dict[str, Dict[str, List[Dict[str, Any]]]] = None) -> List[Dict[str, Any]]:
+                          group_schedule: Optional[Dict[str, Dict[str, List[Dict[str, Any]]]]] = None,
+                          subgroup_schedule: Optional[Dict[str, Dict[str, List[Dict[str, Any]]]]] = None) -> List[Dict[str, Any]]:
     """
     Sort schedules based on the specified mode.
     
@@ -743,23 +1227,41 @@ def sort_schedules_by_mode(schedules: List[Dict[str, Any]],
     if sort_mode == "dead_hours":
         if not group_schedule or not subgroup_schedule:
             return schedules  # Can't sort without schedule data
-          # Calculate dead hours for each schedule and add to schedule data
+        # Calculate dead hours for each schedule and add to schedule data,
+        # walking the raw class data only once for all schedules and
+        # computing each distinct combination only once
+        group_slots = _index_slots_by_number(precompute_subject_slots(group_schedule))
+        subgroup_slots = _index_slots_by_number(precompute_subject_slots(subgroup_schedule))
+        dead_hours_by_combo: Dict[Tuple[Tuple[str, Any, Any], ...], int] = {}
+        keys = []
         for schedule in schedules:
-            dead_hours = calculate_schedule_dead_hours(
-                schedule.get("subjects", {}), group_schedule, subgroup_schedule
-            )
+            schedule_subjects = schedule.get("subjects", {})
+            combo_key = _schedule_combo_key(schedule_subjects)
+            dead_hours = dead_hours_by_combo.get(combo_key)
+            if dead_hours is None:
+                dead_hours = _schedule_dead_hours(schedule_subjects, group_slots, subgroup_slots)
+                dead_hours_by_combo[combo_key] = dead_hours
             schedule["dead_hours"] = dead_hours
+            keys.append(dead_hours)
         
         # Sort by dead hours (ascending - fewer dead hours first)
-        return sorted(schedules, key=lambda x: x.get("dead_hours", 0))
+        return _sort_by_keys(schedules, keys)
     
     elif sort_mode == "groups":
         # Calculate group sum for each schedule and add to schedule data
+        keys = []
         for schedule in schedules:
             group_sum = calculate_schedule_group_sum(schedule.get("subjects", {}))
             schedule["group_sum"] = group_sum
+            keys.append(group_sum)
         
         # Sort by group sum (ascending - lower group numbers first)
-        return sorted(schedules, key=lambda x: x.get("group_sum", 0))
+        return _sort_by_keys(schedules, keys)
     
     return schedules
+
+
+def _sort_by_keys(schedules: List[Dict[str, Any]], keys: List[int]) -> List[Dict[str, Any]]:
+    """Stably sort schedules by precomputed keys without per-item key lookups."""
+    decorated = sorted(zip(keys, range(len(schedules))), key=itemgetter(0))
+    return [schedules[index] for _, index in decorated]
@@ -0,0 +1,151 @@
+"""
+Optional Numba kernel for filtering (group, subgroup) combination pairs.
+
+The kernel applies the slot-conflict and maximum-days checks of
+merge_valid_schedules to every candidate pair in native, parallel code.
+It is only available when both numpy and numba are installed; callers
+must check numba_available() and fall back to the pure Python loop otherwise.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Tuple
+
+# numpy and numba are optional dependencies, imported on first use: loading
+# numba takes a few hundred milliseconds, which every start-up would pay
+np: Any = None
+numba_module: Any = None
+prange: Any = range
+
+WORD_BITS = 64
+WORD_MASK = (1 << WORD_BITS) - 1
+
+
+@lru_cache(maxsize=None)
+def _load_kernel() -> Optional[Callable[..., None]]:
+    """Import numpy and numba and compile the kernel, or return None if unavailable."""
+    global np, numba_module, prange
+    try:
+        import numpy
+        import numba
+    except ImportError:
+        return None
+    np = numpy
+    numba_module = numba
+    prange = numba.prange
+    return numba.njit(parallel=True, cache=True)(_filter_pairs_kernel)
+
+
+def numba_available() -> bool:
+    """
+    Check whether the Numba kernel can be used, importing numba on first call.
+    
+    Returns:
+        True if numpy and numba are installed
+    """
+    return _load_kernel() is not None
+
+
+def split_masks(masks: List[int], words: int) -> Any:
+    """
+    Split arbitrary-size slot bitmasks into a 2D uint64 array.
+
+    Args:
+        masks: List of slot bitmasks
+        words: Number of 64-bit words per mask
+
+    Returns:
+        numpy array of shape (len(masks), words)
+    """
+    return np.array(
+        [[(mask >> (WORD_BITS * k)) & WORD_MASK for k in range(words)] for mask in masks],
+        dtype=np.uint64
+    ).reshape(len(masks), words)
+
+
+def filter_pairs(group_masks: List[int], group_day_masks: List[int],
+                 subgroup_masks: List[int], subgroup_day_masks: List[int],
+                 matching_subgroups: Optional[List[List[int]]],
+                 max_days: int, threads: Optional[int] = None) -> Tuple[List[int], List[int]]:
+    """
+    Find the candidate pairs that have no slot conflict and few enough days.
+
+    Candidates are every (group, subgroup) pair when matching_subgroups is
+    None, otherwise the subgroup indices listed for each group, in order.
+
+    Args:
+        group_masks: Slot bitmask per group combination
+        group_day_masks: Day bitmask per group combination
+        subgroup_masks: Slot bitmask per subgroup combination
+        subgroup_day_masks: Day bitmask per subgroup combination
+        matching_subgroups: Optional candidate subgroup indices per group combination
+        max_days: Maximum allowed days with classes
+        threads: Maximum number of kernel threads, by default all of Numba's
+
+    Returns:
+        Tuple of (group_indices, subgroup_indices) lists of the surviving pairs, row by row
+    """
+    kernel = _load_kernel()
+    assert kernel is not None, "filter_pairs requires numba_available()"
+    
+    bits = max(max(group_masks, default=0).bit_length(), max(subgroup_masks, default=0).bit_length())
+    words = max(-(-bits // WORD_BITS), 1)
+    g_words = split_masks(group_masks, words)
+    s_words = split_masks(subgroup_masks, words)
+    g_days = np.array(group_day_masks, dtype=np.int64)
+    s_days = np.array(subgroup_day_masks, dtype=np.int64)
+
+    if matching_subgroups is None:
+        dense = True
+        row_ptr = np.zeros(1, dtype=np.int64)
+        cols = np.zeros(1, dtype=np.int64)
+        total = len(group_masks) * len(subgroup_masks)
+    else:
+        dense = False
+        row_ptr = np.zeros(len(matching_subgroups) + 1, dtype=np.int64)
+        np.cumsum([len(row) for row in matching_subgroups], out=row_ptr[1:])
+        cols = np.array([si for row in matching_subgroups for si in row], dtype=np.int64)
+        total = len(cols)
+
+    keep = np.zeros(total, dtype=np.bool_)
+    if threads:
+        # Per calling thread, and may not exceed the pool Numba started with
+        numba_module.set_num_threads(max(min(threads, numba_module.config.NUMBA_NUM_THREADS), 1))
+    if total:
+        kernel(g_words, g_days, s_words, s_days, row_ptr, cols, dense, max_days, keep)
+
+    positions = np.flatnonzero(keep)
+    if dense:
+        group_indices, subgroup_indices = np.divmod(positions, len(subgroup_masks))
+    else:
+        group_indices = np.searchsorted(row_ptr, positions, side="right") - 1
+        subgroup_indices = cols[positions]
+    return group_indices.tolist(), subgroup_indices.tolist()
+
+
+def _filter_pairs_kernel(g_words, g_days, s_words, s_days, row_ptr, cols, dense, max_days, keep):
+    """Parallel over group combinations; each row writes its own slice of keep."""
+    n = g_words.shape[0]
+    m = s_words.shape[0]
+    w = g_words.shape[1]
+    for i in prange(n):
+        if dense:
+            start = i * m
+            count = m
+        else:
+            start = row_ptr[i]
+            count = row_ptr[i + 1] - start
+        for k in range(count):
+            j = k if dense else cols[start + k]
+            ok = True
+            for b in range(w):
+                if g_words[i, b] & s_words[j, b]:
+                    ok = False
+                    break
+            if ok:
+                days = g_days[i] | s_days[j]
+                day_count = 0
+                while days:
+                    days &= days - 1
+                    day_count += 1
+                ok = day_count <= max_days
+            keep[start + k] = ok
@@ -2,24 +2,141 @@
 Interactive mode module for selecting options and running the application.
 """
 
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import Dict, List, Tuple, Any
-
-import questionary
-from rich.console import Console
+from functools import lru_cache
+from typing import Dict, List, Tuple, Any, Union
 
 from app.core.constants import SUBJECT_COLORS
-from app.api import fetch_classes_data, fetch_subject_names
-from app.core.parser import parse_classes_data
 from app.core.utils import clear_screen, normalize_language
 from app.ui.ui import (
-    QUESTIONARY_STYLE, 
     display_splash_screen, 
     display_subjects_list, 
     navigate_schedules
 )
 
-console = Console()
+# questionary pulls in prompt_toolkit, which takes longer to import than the
+# splash screen takes to draw; _load_questionary() imports it after the splash
+questionary: Any = None
+QUESTIONARY_STYLE: Any = None
+
+# Prompt options shared by the search parameter prompts; the style is added on load
+_SELECT_KWARGS: Dict[str, Any] = {
+    "instruction": "(Use ↑↓ and Enter)",
+    "use_jk_keys": False,
+    "use_search_filter": True,
+}
+_CHECKBOX_KWARGS: Dict[str, Any] = {
+    "instruction": "(Use ↑↓, Space toggle and Enter)",
+    "use_jk_keys": False,
+    "use_search_filter": True,
+}
+_HOUR_CHOICES = [str(h) for h in range(8, 22)]
+_DAY_CHOICES = [str(i) for i in range(1, 6)]
+# Plain decimal marks such as "7", "7.5" or ".5"; no signs, exponents, nan or inf
+_MARK_PATTERN = re.compile(r"(?:\d+\.?\d*|\.\d+)", re.ASCII)
+
+
+@lru_cache(maxsize=1)
+def _load_questionary() -> None:
+    """Import questionary and build the prompt style, once per session."""
+    global questionary, QUESTIONARY_STYLE
+    import questionary as questionary_module
+    from questionary import Style as QStyle
+    
+    questionary = questionary_module
+    QUESTIONARY_STYLE = QStyle([
+        ("qmark", "fg:#FF5555 bold"),
+        ("question", "fg:#FFFFFF"),
+        ("answer", "fg:#FFFFFF"),
+        ("pointer", "fg:#666666 bold"),
+        ("highlighted", "fg:#FF5555 bold"),
+        ("selected", "fg:#AAAAAA"),
+        ("separator", "fg:#AAAAAA"),
+        ("instruction", "fg:#AAAAAA"),
+        ("text", "fg:#AAAAAA"),
+    ])
+    _SELECT_KWARGS["style"] = QUESTIONARY_STYLE
+    _CHECKBOX_KWARGS["style"] = QUESTIONARY_STYLE
+
+
+@lru_cache(maxsize=1)
+def _console() -> Any:
+    """Create the console used for error messages on first use."""
+    from rich.console import Console
+    return Console()
+
+
+def _validate_selection(answers: List[str]) -> Union[bool, str]:
+    """Require at least one checked option in a checkbox prompt."""
+    return True if answers else "Select at least one"
+
+
+def _validate_formula(text: str) -> bool:
+    """Require a non-blank formula."""
+    return bool(text.strip())
+
+
+def _validate_mark(text: str) -> Union[bool, str]:
+    """Require a mark between 0 and 10."""
+    if not text:
+        return "Enter a value"
+    if not _MARK_PATTERN.fullmatch(text):
+        return "Not a number"
+    return True if 0.0 <= float(text) <= 10.0 else "Out of range 0-10"
+
+# Class data and subject names fetched during this session; they do not
+# change while the app runs, so repeated searches skip the network
+_parsed_data_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_names_cache: Dict[str, Dict[str, str]] = {}
+_subject_choices_cache: Dict[Tuple[str, str], Tuple[List[str], Dict[str, str]]] = {}
+
+
+def get_session_parsed_data(quad: str, lang: str) -> Dict[str, Any]:
+    """
+    Fetch and parse the class data of a quadrimester, once per session.
+    
+    Empty results are not cached, so a failed request is retried next time.
+    
+    Args:
+        quad: Quadrimester code
+        lang: Language code
+    
+    Returns:
+        Parsed class data
+    """
+    key = (quad, lang)
+    parsed_data = _parsed_data_cache.get(key)
+    if parsed_data is None:
+        from app.api import fetch_classes_data
+        from app.core.parser import parse_classes_data
+        
+        parsed_data = parse_classes_data(fetch_classes_data(quad, lang))
+        if parsed_data:
+            _parsed_data_cache[key] = parsed_data
+    return parsed_data
+
+
+def get_session_subject_names(lang: str) -> Dict[str, str]:
+    """
+    Fetch the subject names in a language, once per session.
+    
+    Args:
+        lang: Language code
+    
+    Returns:
+        Dictionary mapping subject codes to subject names
+    """
+    names = _names_cache.get(lang)
+    if names is None:
+        from app.api import fetch_subject_names
+        
+        names = fetch_subject_names(lang)
+        if names:
+            _names_cache[lang] = names
+    return names
+
 
 def select_year() -> int:
     """
@@ -64,14 +181,35 @@ def select_language() -> str:
     choice = questionary.select(
         "Select language:", 
         choices=["English", "Spanish", "Catalan"],
-        instruction="(Use ↑↓ and Enter)", 
-        style=QUESTIONARY_STYLE,
-        use_jk_keys=False, 
-        use_search_filter=True
+        **_SELECT_KWARGS
     ).ask()
     return normalize_language(choice)
 
 
+def get_session_subject_choices(quad: str, lang: str) -> Tuple[List[str], Dict[str, str]]:
+    """
+    Build the "CODE - Name" choices of the subject prompt, once per session.
+    
+    Args:
+        quad: Quadrimester code
+        lang: Language code
+    
+    Returns:
+        Tuple of (subject choices sorted by code, mapping from choice to subject code)
+    """
+    key = (quad, lang)
+    cached = _subject_choices_cache.get(key)
+    if cached is None:
+        parsed_data = get_session_parsed_data(quad, lang)
+        names = get_session_subject_names(lang)
+        choice_codes = {f"{code} - {names.get(code, code)}": code for code in sorted(parsed_data)}
+        cached = (list(choice_codes), choice_codes)
+        # Only keep choices built from data that is itself cached
+        if key in _parsed_data_cache and lang in _names_cache:
+            _subject_choices_cache[key] = cached
+    return cached
+
+
 def get_group_choices(parsed_data: dict, subjects: list[str]) -> list[str]:
     """
     Get the available group choices for blacklisting.
@@ -83,13 +221,12 @@ def get_group_choices(parsed_data: dict, subjects: list[str]) -> list[str]:
     Returns:
         List of group choices
     """
-    choices = []
-    for subject in subjects:
-        subj = subject.upper()
-        for group in parsed_data.get(subj, {}):
-            if group.isdigit():
-                choices.append(f"{subj}-{group}")
-    return sorted(choices)
+    return sorted(
+        f"{subj}-{group}"
+        for subj in map(str.upper, subjects)
+        for group in parsed_data.get(subj, ())
+        if group.isdigit()
+    )
 
 
 def select_search_params() -> tuple:
@@ -99,36 +236,37 @@ def select_search_params() -> tuple:
     Returns:
         Tuple of search parameters
     """
+    _load_questionary()
     year = select_year()
     quad_num = select_quadrimester()
     quad = f"{year}Q{quad_num}"
     
+    # Fetch the class data in the background while the user answers the
+    # remaining prompts; only the subject selection needs it. The worker
+    # threads are joined at exit, which the API request timeout keeps short
+    # if the user quits while a fetch is stalled
+    executor = ThreadPoolExecutor(max_workers=2)
+    parsed_data_future = executor.submit(get_session_parsed_data, quad, "en")
+    names_future = executor.submit(get_session_subject_names, "en")
+    executor.shutdown(wait=False)
+    
     start_hour = int(questionary.select(
         "Start hour:", 
-        choices=[str(h) for h in range(8, 21)],
-        instruction="(Use ↑↓ and Enter)", 
-        style=QUESTIONARY_STYLE,
-        use_jk_keys=False, 
-        use_search_filter=True
+        choices=_HOUR_CHOICES[:-1],
+        **_SELECT_KWARGS
     ).ask())
     
     end_hour = int(questionary.select(
         "End hour:", 
-        choices=[str(h) for h in range(start_hour+1, 22)],
-        instruction="(Use ↑↓ and Enter)", 
-        style=QUESTIONARY_STYLE,
-        use_jk_keys=False, 
-        use_search_filter=True
+        choices=_HOUR_CHOICES[_HOUR_CHOICES.index(str(start_hour)) + 1:],
+        **_SELECT_KWARGS
     ).ask())
     
     days = int(questionary.select(
         "Maximum days with classes:", 
-        choices=[str(i) for i in range(1, 6)],
+        choices=_DAY_CHOICES,
         default="5", 
-        instruction="(Use ↑↓ and Enter)", 
-        style=QUESTIONARY_STYLE,
-        use_jk_keys=False, 
-        use_search_filter=True
+        **_SELECT_KWARGS
     ).ask())
     
     relax_days = 5 - days
@@ -146,60 +284,44 @@ def select_search_params() -> tuple:
     languages_native = questionary.checkbox(
         "Select languages of the classes:",
         choices=["English", "Spanish", "Catalan"],
-        instruction="(Use ↑↓, Space toggle and Enter)",
-        style=QUESTIONARY_STYLE, 
-        validate=lambda ans: True if ans else "Select at least one",
-        use_jk_keys=False, 
-        use_search_filter=True
+        validate=_validate_selection,
+        **_CHECKBOX_KWARGS
     ).ask()
     
     languages = [normalize_language(l) for l in languages_native]
     
-    raw_data = fetch_classes_data(quad, "en")
-    parsed_data = parse_classes_data(raw_data)
-    names = fetch_subject_names("en")
+    parsed_data = parsed_data_future.result()
+    names_future.result()
     
-    subject_choices = [f"{code} - {names.get(code, code)}" for code in sorted(parsed_data.keys())]
+    subject_choices, choice_codes = get_session_subject_choices(quad, "en")
     
     subjects_selected = questionary.checkbox(
         "Select subjects:", 
         choices=subject_choices,
-        instruction="(Use ↑↓, Space toggle and Enter)",
-        style=QUESTIONARY_STYLE, 
-        validate=lambda ans: True if ans else "Select at least one",
-        use_jk_keys=False, 
-        use_search_filter=True
+        validate=_validate_selection,
+        **_CHECKBOX_KWARGS
     ).ask()
     
-    subjects = [item.split(" - ", 1)[0].upper() for item in subjects_selected]
+    subjects = [choice_codes[item] for item in subjects_selected]
     blacklist_choices = get_group_choices(parsed_data, subjects)
     
     blacklisted = questionary.checkbox(
         "Blacklisted groups:", 
         choices=blacklist_choices,
-        instruction="(Use ↑↓, Space toggle and Enter)", 
-        style=QUESTIONARY_STYLE,
-        use_jk_keys=False, 
-        use_search_filter=True
+        **_CHECKBOX_KWARGS
     ).ask()
     
     whitelisted = questionary.checkbox(
         "Whitelisted groups (must be included):", 
         choices=blacklist_choices,
-        instruction="(Use ↑↓, Space toggle and Enter)", 
-        style=QUESTIONARY_STYLE,
-        use_jk_keys=False, 
-        use_search_filter=True
+        **_CHECKBOX_KWARGS
     ).ask()
     
     max_dead_hours_choice = questionary.select(
         "Maximum dead hours allowed:", 
         choices=["No limit", "0", "1", "2", "3", "4", "5"],
         default="No limit", 
-        instruction="(Use ↑↓ and Enter)", 
-        style=QUESTIONARY_STYLE,
-        use_jk_keys=False, 
-        use_search_filter=True
+        **_SELECT_KWARGS
     ).ask()
     
     # Convert "No limit" to -1, otherwise convert to int
@@ -213,11 +335,14 @@ def select_search_params() -> tuple:
 
 def display_subjects_for_selection() -> None:
     """Display subjects list with interactive selection."""
+    _load_questionary()
     year = select_year()
     quad_num = select_quadrimester()
     quad = f"{year}Q{quad_num}"
     lang_choice = select_language()
-    display_subjects_list(quad, lang_choice)
+    display_subjects_list(quad, lang_choice,
+                          get_session_parsed_data(quad, lang_choice),
+                          get_session_subject_names(lang_choice))
 
 
 def perform_app_search() -> None:
@@ -233,7 +358,7 @@ def perform_app_search() -> None:
     schedules = result.get("schedules", [])
     
     if not schedules:
-        console.print("No schedules found.", style="error", justify="center")
+        _console().print("No schedules found.", style="error", justify="center")
     else:
         navigate_schedules(schedules, parsed_data, start_hour, end_hour, group_schedule, subgroup_schedule)
 
@@ -253,6 +378,7 @@ def perform_marks_calculation() -> None:
     if not check_windows_interactive():
         return
     
+    _load_questionary()
     clear_screen()
     
     try:
@@ -261,7 +387,7 @@ def perform_marks_calculation() -> None:
             "Enter formula:",
             instruction="Use variable names for marks (e.g., EX1*0.4+EX2*0.6)",
             style=QUESTIONARY_STYLE,
-            validate=lambda text: bool(text.strip())
+            validate=_validate_formula
         ).ask()
         
         if not formula:
@@ -272,7 +398,7 @@ def perform_marks_calculation() -> None:
             "Enter target mark:",
             instruction="The minimum mark you want to achieve (e.g., 5.0)",
             style=QUESTIONARY_STYLE,
-            validate=lambda text: text.replace('.', '', 1).isdigit() and 0 <= float(text) <= 10
+            validate=_validate_mark
         ).ask()
         
         if not target_text:
@@ -295,7 +421,7 @@ def perform_marks_calculation() -> None:
                     f"Enter value for {var}:",
                     instruction="Enter a number from 0 to 10",
                     style=QUESTIONARY_STYLE,
-                    validate=lambda text: text.replace('.', '', 1).isdigit() and 0 <= float(text) <= 10
+                    validate=_validate_mark
                 ).ask()
                 
                 if var_value:
@@ -307,7 +433,7 @@ def perform_marks_calculation() -> None:
         # Display results
         display_marks_results(formula, values, target, solution, result)
     except Exception as e:
-        console.print(f"Error in marks calculation: {str(e)}", style="error", justify="center")
+        _console().print(f"Error in marks calculation: {str(e)}", style="error", justify="center")
         import traceback
         traceback.print_exc()
         input("Press Enter to continue...")
@@ -320,6 +446,7 @@ def run_interactive_app() -> None:
     
     try:
         display_splash_screen()
+        _load_questionary()
         
         while True:
             try:
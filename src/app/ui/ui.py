@@ -13,21 +13,35 @@ try:
     import msvcrt
 except ImportError:
     msvcrt = None
-from typing import Dict, List, Any
-from pyfiglet import figlet_format
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
 from rich.console import Console
 from rich.table import Table
 from rich.theme import Theme
 from rich.text import Text
 from rich.align import Align
 from rich import box
-import questionary
-from questionary import Style as QStyle
 
-from app.core.constants import WEEKDAYS, LANG_FLAGS, SUBJECT_COLORS, SORT_MODE_GROUPS, SORT_MODE_DEAD_HOURS
-from app.core.utils import clear_screen, hide_cursor, show_cursor, normalize_language, is_interactive_mode
-from app.core.parser import parse_classes_data
-from app.core.validator import sort_schedules_by_mode
+from app.core.constants import WEEKDAYS, SUBJECT_COLORS, SORT_MODE_GROUPS, SORT_MODE_DEAD_HOURS
+from app.core.utils import clear_screen, hide_cursor, show_cursor, is_interactive_mode
+
+
+# Arrow key codes, following the '\xe0' prefix on Windows
+WINDOWS_ARROW_KEYS = {
+    'K': 'LEFT',   # Left arrow
+    'M': 'RIGHT',  # Right arrow
+    'H': 'UP',     # Up arrow  
+    'P': 'DOWN'    # Down arrow
+}
+
+# Arrow key escape sequences on Unix terminals
+UNIX_ARROW_KEYS = {
+    b'\x1b[A': 'UP',
+    b'\x1b[B': 'DOWN', 
+    b'\x1b[C': 'RIGHT',
+    b'\x1b[D': 'LEFT'
+}
 
 
 def get_key_input():
@@ -38,13 +52,7 @@ def get_key_input():
         if key == '\xe0':  # Special key prefix on Windows
             code = msvcrt.getwch()
             # Map Windows arrow key codes to consistent names
-            arrow_map = {
-                'K': 'LEFT',   # Left arrow
-                'M': 'RIGHT',  # Right arrow
-                'H': 'UP',     # Up arrow  
-                'P': 'DOWN'    # Down arrow
-            }
-            return arrow_map.get(code, key + code)
+            return WINDOWS_ARROW_KEYS.get(code, key + code)
         return key
     else:
         # Unix/Linux
@@ -54,46 +62,38 @@ def get_key_input():
         fd = sys.stdin.fileno()
         old_settings = termios.tcgetattr(fd)
         try:
-            tty.setraw(sys.stdin.fileno())
-            
-            # Read the first character
-            key = sys.stdin.read(1)
-            
-            # Handle escape sequences (arrow keys, function keys, etc.)
-            if key == '\x1b':  # ESC character
-                # For arrow keys, we expect the sequence to be: ESC [ {A,B,C,D}
-                # Read the full sequence in raw mode
-                try:
-                    # Read next character - should be '['
-                    bracket = sys.stdin.read(1)
-                    if bracket == '[':
-                        # Read the direction character
-                        direction = sys.stdin.read(1)
-                        sequence = key + bracket + direction
-                        
-                        # Map arrow keys to more intuitive names
-                        arrow_map = {
-                            '\x1b[A': 'UP',
-                            '\x1b[B': 'DOWN', 
-                            '\x1b[C': 'RIGHT',
-                            '\x1b[D': 'LEFT'
-                        }
-                        mapped_key = arrow_map.get(sequence)
-                        if mapped_key:
-                            return mapped_key
-                        else:
-                            # Unknown escape sequence, return as-is
-                            return sequence
-                    else:
-                        # Not an arrow key sequence, return the characters we read
-                        return key + bracket
-                except:
-                    # If we can't read more characters, it's probably just ESC
-                    return key
-            
-            return key
+            tty.setraw(fd)
+            # Terminals deliver a whole key (including escape sequences such
+            # as arrow keys) at once, so a single read returns all of it;
+            # anything past the first key is discarded, as setraw flushes
+            # unread input on the next call anyway
+            raw = os.read(fd, 8)
         finally:
             termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        
+        # Handle escape sequences (arrow keys, function keys, etc.)
+        if raw.startswith(b'\x1b'):  # ESC character
+            if raw[1:2] == b'[':
+                # For arrow keys, we expect the sequence to be: ESC [ {A,B,C,D}
+                sequence = raw[:3]
+                # Unknown escape sequences are returned as-is
+                return UNIX_ARROW_KEYS.get(sequence) or sequence.decode(errors="replace")
+            # Not an arrow key sequence (or just ESC), return what was read
+            return raw[:2].decode(errors="replace")
+        
+        return raw.decode(sys.stdin.encoding or "utf-8", errors="ignore")[:1]
+
+
+def key_pending() -> bool:
+    """
+    Check whether another key press is already waiting to be read.
+    
+    Returns:
+        True if get_key_input would return without blocking. Always False on
+        Unix, where get_key_input discards keys queued before it is called,
+        so there is never a backlog to skip
+    """
+    return msvcrt is not None and msvcrt.kbhit()
 
 
 # Setup console and theme
@@ -105,23 +105,37 @@ UI_THEME = Theme({
     "error": "bold red",
 })
 
-QUESTIONARY_STYLE = QStyle([
-    ("qmark", "fg:#FF5555 bold"),
-    ("question", "fg:#FFFFFF"),
-    ("answer", "fg:#FFFFFF"),
-    ("pointer", "fg:#666666 bold"),
-    ("highlighted", "fg:#FF5555 bold"),
-    ("selected", "fg:#AAAAAA"),
-    ("separator", "fg:#AAAAAA"),
-    ("instruction", "fg:#AAAAAA"),
-    ("text", "fg:#AAAAAA"),
-])
-
-console = Console(theme=UI_THEME)
+# Nothing printed here uses Rich markup, emoji codes or repr highlighting; styles
+# are always passed explicitly, so skip scanning every string for them
+console = Console(theme=UI_THEME, markup=False, emoji=False, highlight=False)
 
 # Ensure terminal cursor gets restored
 atexit.register(lambda: show_cursor() if sys.stdout.isatty() else None)
 
+# Coefficient patterns for the marks table, e.g. "EX1*0.4" and "0.4*EX1"
+VAR_TIMES_COEFFICIENT_PATTERN = re.compile(r"\b([A-Za-z][A-Za-z0-9]*)\s*\*\s*(0\.\d+)")
+COEFFICIENT_TIMES_VAR_PATTERN = re.compile(r"(0\.\d+)\s*\*\s*([A-Za-z][A-Za-z0-9]*)\b")
+
+# Static parts of the schedule screen, built once instead of on every redraw
+SCHEDULE_HEADER_PREFIX = Text("Schedule ", style="white")
+SCHEDULE_HEADER_SEPARATOR = Text("/", style="bright_black")
+FOOTER_OPEN_URL = Text("SPACE to open schedule URL")
+FOOTER_SHOW_GROUPS = Text("TAB to show groups")
+FOOTER_SHOW_SCHEDULE = Text("TAB to show schedule")
+FOOTER_SORT_DEAD_HOURS = Text("S to sort by dead hours")
+FOOTER_SORT_GROUPS = Text("S to sort by groups")
+FOOTER_NAVIGATE = Text("←→ to navigate")
+FOOTER_EXIT = Text("E to leave\nQ to quit")
+
+
+@contextmanager
+def batched_output() -> Iterator[None]:
+    """Render console output into a buffer and write it to the terminal in one call."""
+    with console.capture() as capture:
+        yield
+    sys.stdout.write(capture.get())
+    sys.stdout.flush()
+
 
 def check_windows_interactive() -> bool:
     """
@@ -137,6 +151,35 @@ def check_windows_interactive() -> bool:
     return False
 
 
+def _flatten_schedule(schedule: dict, parsed_classes: dict,
+                      subject_colors: dict) -> List[Tuple[str, str, List[Dict[str, Any]]]]:
+    """
+    Resolve everything the grid needs per selected group in a single pass.
+    
+    Args:
+        schedule: Schedule dictionary
+        parsed_classes: Parsed class data
+        subject_colors: Dictionary mapping subjects to colors
+    
+    Returns:
+        List of (label, color, classes) tuples, one per selected group or
+        subgroup, where label is the "SUBJECT GROUP" cell prefix
+    """
+    flat = []
+    for subject, info in schedule.get("subjects", {}).items():
+        subject = sys.intern(subject)
+        color = subject_colors.get(subject, "primary")
+        subject_groups = parsed_classes.get(subject, {})
+        for grp_type in ("group", "subgroup"):
+            group = info.get(grp_type)
+            if not group:
+                continue
+            # Classes are listed under the group they belong to, so the label
+            # is the group being walked; no need to search the group's classes
+            flat.append((f"{subject} {group}", color, subject_groups.get(str(group), [])))
+    return flat
+
+
 def create_schedule_grid(schedule: dict, parsed_classes: dict, start_hour: int, end_hour: int, subject_colors: dict) -> Table:
     """
     Create a grid table for displaying a schedule.
@@ -151,36 +194,38 @@ def create_schedule_grid(schedule: dict, parsed_classes: dict, start_hour: int,
     Returns:
         Rich Table object
     """
-    grid = {}
-    subjects_info = schedule.get("subjects", {})
-    for subject, info in subjects_info.items():
-        for grp_type in ("group", "subgroup"):
-            group = info.get(grp_type)
-            if not group:
-                continue
-            for class_info in parsed_classes.get(subject, {}).get(str(group), []):
-                key = (class_info["day"], class_info["hour"])
-                grid.setdefault(key, []).append((subject, class_info, info))
+    # Entries bucketed straight into an hour x weekday matrix as finished
+    # (line, style) pairs; classes outside the displayed hours or weekdays
+    # have no slot and are skipped
+    day_count = len(WEEKDAYS)
+    hour_count = max(end_hour - start_hour, 0)
+    grid: List[List[List[Tuple[str, str]]]] = [
+        [[] for _ in range(day_count)] for _ in range(hour_count)
+    ]
+    for label, color, classes in _flatten_schedule(schedule, parsed_classes, subject_colors):
+        for class_info in classes:
+            hour_index = class_info["hour"] - start_hour
+            day_index = class_info["day"] - 1
+            if 0 <= hour_index < hour_count and 0 <= day_index < day_count:
+                line = "".join((label, class_info["_type_letter"], "\n",
+                                class_info["_classroom"], "\n", class_info["_flags"]))
+                grid[hour_index][day_index].append((line, color))
     
     table = Table(show_lines=True, title="Schedule", header_style="secondary", box=box.SIMPLE_HEAVY)
     table.add_column("Hour", justify="right", header_style="bold")
     for day in WEEKDAYS:
         table.add_column(day, justify="center", style="accent", header_style="bold")
     
-    for hour in range(start_hour, end_hour):
-        row = [f"{hour} - {hour + 1}"]
-        for day_index in range(len(WEEKDAYS)):
-            entries = grid.get((day_index + 1, hour), [])
+    for hour, hour_entries in zip(range(start_hour, end_hour), grid):
+        row: List[Union[str, Text]] = [f"{hour} - {hour + 1}"]
+        for entries in hour_entries:
+            # Most cells are empty; those need no Text of their own
+            if not entries:
+                row.append("")
+                continue
             cell = Text()
-            for subject, class_info, info in entries:
-                type_letter = class_info.get("type", "")[:1].upper()
-                flags = [LANG_FLAGS.get(normalize_language(lang.strip()), "") 
-                         for lang in class_info.get("language", "").split(",") if lang.strip()]
-                flag_text = " ".join(flags)
-                group_val = info["group"] if class_info in parsed_classes.get(subject, {}).get(str(info["group"]), []) else info.get("subgroup", "")
-                classroom = class_info.get("classroom", "").replace(",", "")
-                line = f"{subject} {group_val}{type_letter}\n{classroom}\n{flag_text}"
-                cell.append(line, style=subject_colors.get(subject, "primary"))
+            for line, color in entries:
+                cell.append(line, style=color)
             row.append(cell)
         table.add_row(*row)
     
@@ -237,8 +282,8 @@ def display_interface_schedule(index: int, total: int, schedules: list[dict], pa
         console.print("No sessions available for this schedule.", style="warning", justify="center")
         return
     
-    header = Text("Schedule ", style="white") + Text(f"{index+1}", style="#FF5555") + \
-             Text("/", style="bright_black") + Text(f"{total}", style="#FF5555")
+    header = SCHEDULE_HEADER_PREFIX + Text(f"{index+1}", style="#FF5555") + \
+             SCHEDULE_HEADER_SEPARATOR + Text(f"{total}", style="#FF5555")
     console.rule(header, style="accent")
     console.print()
     
@@ -250,16 +295,15 @@ def display_interface_schedule(index: int, total: int, schedules: list[dict], pa
         console.print(subj_table, justify="center")
         console.print()
     
-    console.print("SPACE to open schedule URL", style="primary", justify="center")
-    toggle_text = "TAB to show groups" if grid_view else "TAB to show schedule"
-    console.print(toggle_text, style="primary", justify="center")
-    console.print("←→ to navigate", style="warning", justify="center")
-    console.print("E to leave\nQ to quit", style="accent", justify="center")
+    console.print(FOOTER_OPEN_URL, style="primary", justify="center")
+    console.print(FOOTER_SHOW_GROUPS if grid_view else FOOTER_SHOW_SCHEDULE, style="primary", justify="center")
+    console.print(FOOTER_NAVIGATE, style="warning", justify="center")
+    console.print(FOOTER_EXIT, style="accent", justify="center")
 
 
 def display_interface_schedule_with_sort(index: int, total: int, schedules: list[dict], parsed_classes: dict,
                                          start_hour: int, end_hour: int, subject_colors: dict, grid_view: bool, 
-                                         sort_mode: str) -> None:
+                                         sort_mode: str, table: Optional[Table] = None) -> None:
     """
     Display a schedule in the interface with sorting information.
     
@@ -273,40 +317,40 @@ def display_interface_schedule_with_sort(index: int, total: int, schedules: list
         subject_colors: Dictionary mapping subjects to colors
         grid_view: Whether to display the schedule as a grid
         sort_mode: Current sorting mode
+        table: Already built table for the current view, built here when not given
     """
     clear_screen()
     hide_cursor()
-    schedule = schedules[index]
-    
-    if not schedule.get("subjects"):
-        console.print("No sessions available for this schedule.", style="warning", justify="center")
-        return    # Create simple header
-    header = Text("Schedule ", style="white") + Text(f"{index+1}", style="#FF5555") + \
-             Text("/", style="bright_black") + Text(f"{total}", style="#FF5555")
-    
-    console.rule(header, style="accent")
-    console.print()
-    
-    if grid_view:
-        grid_table = create_schedule_grid(schedule, parsed_classes, start_hour, end_hour, subject_colors)
-        console.print(grid_table, justify="center")
-    else:
-        subj_table = create_subject_info_table(schedule, subject_colors)
-        console.print(subj_table, justify="center")
+    with batched_output():
+        schedule = schedules[index]
+        
+        if not schedule.get("subjects"):
+            console.print("No sessions available for this schedule.", style="warning", justify="center")
+            return
+        header = SCHEDULE_HEADER_PREFIX + Text(f"{index+1}", style="#FF5555") + \
+                 SCHEDULE_HEADER_SEPARATOR + Text(f"{total}", style="#FF5555")
+        
+        console.rule(header, style="accent")
         console.print()
-    console.print("SPACE to open schedule URL", style="primary", justify="center")
-    toggle_text = "TAB to show groups" if grid_view else "TAB to show schedule"
-    console.print(toggle_text, style="primary", justify="center")
-    
-    # Add sort toggle information (showing the opposite mode that will be activated)
-    if sort_mode == SORT_MODE_GROUPS:
-        sort_text = "S to sort by dead hours"
-    else:  # SORT_MODE_DEAD_HOURS
-        sort_text = "S to sort by groups"
-    
-    console.print(sort_text, style="primary", justify="center")
-    console.print("←→ to navigate", style="warning", justify="center")
-    console.print("E to leave\nQ to quit", style="accent", justify="center")
+        
+        if grid_view:
+            grid_table = table or create_schedule_grid(schedule, parsed_classes, start_hour, end_hour, subject_colors)
+            console.print(grid_table, justify="center")
+        else:
+            subj_table = table or create_subject_info_table(schedule, subject_colors)
+            console.print(subj_table, justify="center")
+            console.print()
+        console.print(FOOTER_OPEN_URL, style="primary", justify="center")
+        console.print(FOOTER_SHOW_GROUPS if grid_view else FOOTER_SHOW_SCHEDULE, style="primary", justify="center")
+        
+        # Add sort toggle information (showing the opposite mode that will be activated)
+        if sort_mode == SORT_MODE_GROUPS:
+            console.print(FOOTER_SORT_DEAD_HOURS, style="primary", justify="center")
+        else:  # SORT_MODE_DEAD_HOURS
+            console.print(FOOTER_SORT_GROUPS, style="primary", justify="center")
+        
+        console.print(FOOTER_NAVIGATE, style="warning", justify="center")
+        console.print(FOOTER_EXIT, style="accent", justify="center")
 
 
 def navigate_schedules(schedules: list[dict], parsed_classes: dict, start_hour: int, end_hour: int, 
@@ -322,45 +366,77 @@ def navigate_schedules(schedules: list[dict], parsed_classes: dict, start_hour:
         group_schedule: Optional group schedule data for sorting
         subgroup_schedule: Optional subgroup schedule data for sorting
     """
+    # The validator imports the API client; keep both off the splash screen path
+    from app.core.validator import sort_schedules_by_mode
+    
     if not schedules:
         console.print("No schedules found.", style="error", justify="center")
         clear_screen()
         return
     
     # Initialize state variables
-    current_schedules = schedules[:]  # Make a copy to avoid modifying original
+    current_schedules = schedules  # Never modified in place; sorting returns a new list
     current_sort_mode = SORT_MODE_GROUPS  # Default sort mode
     total = len(current_schedules)
     current_index = 0
     grid_view = True
+    all_subjects = set().union(*(sched.get("subjects", {}).keys() for sched in current_schedules))
     subject_colors = {subject: SUBJECT_COLORS[i % len(SUBJECT_COLORS)] 
-                      for i, subject in enumerate(sorted({s for sched in current_schedules for s in sched.get("subjects", {})}))}
-    
-    display_interface_schedule_with_sort(current_index, total, current_schedules, parsed_classes, 
-                                       start_hour, end_hour, subject_colors, grid_view, current_sort_mode)
-    
-    while is_interactive_mode():
+                      for i, subject in enumerate(sorted(all_subjects))}
+    
+    # Tables built per (schedule, view); sorting only reorders the same
+    # schedule dicts, so cached tables stay valid across sort toggles
+    table_cache: Dict[Tuple[int, bool], Table] = {}
+    # Sorted orders per mode, computed the first time each mode is selected
+    sort_cache: Dict[str, List[dict]] = {}
+    
+    def get_table(index: int) -> Table:
+        schedule = current_schedules[index]
+        key = (id(schedule), grid_view)
+        table = table_cache.get(key)
+        if table is None:
+            if grid_view:
+                table = create_schedule_grid(schedule, parsed_classes, start_hour, end_hour, subject_colors)
+            else:
+                table = create_subject_info_table(schedule, subject_colors)
+            table_cache[key] = table
+        return table
+    
+    # Key handlers only update the state and flag a redraw; the screen is
+    # redrawn once no further key is waiting, so a burst of presses (such as
+    # a held arrow key) renders only its final state
+    redraw = True
+    while True:
+        if redraw and not key_pending():
+            display_interface_schedule_with_sort(current_index, total, current_schedules, parsed_classes, 
+                                               start_hour, end_hour, subject_colors, grid_view, current_sort_mode,
+                                               get_table(current_index))
+            redraw = False
+        if not is_interactive_mode():
+            break
         key = get_key_input()
         if key == " ":
             webbrowser.open(current_schedules[current_index]["url"])
         elif key == "\t":
             grid_view = not grid_view
-            display_interface_schedule_with_sort(current_index, total, current_schedules, parsed_classes, 
-                                                start_hour, end_hour, subject_colors, grid_view, current_sort_mode)
+            redraw = True
         elif key.lower() == "s":
             # Toggle sort mode
             current_sort_mode = SORT_MODE_DEAD_HOURS if current_sort_mode == SORT_MODE_GROUPS else SORT_MODE_GROUPS
-            # Re-sort schedules
-            current_schedules = sort_schedules_by_mode(schedules[:], current_sort_mode, group_schedule, subgroup_schedule)
+            # Re-sort schedules, reusing the order from an earlier toggle to the same mode
+            if current_sort_mode not in sort_cache:
+                sort_cache[current_sort_mode] = sort_schedules_by_mode(schedules, current_sort_mode,
+                                                                      group_schedule, subgroup_schedule)
+            current_schedules = sort_cache[current_sort_mode]
             current_index = 0  # Reset to first schedule after sorting
-            display_interface_schedule_with_sort(current_index, total, current_schedules, parsed_classes, 
-                                                start_hour, end_hour, subject_colors, grid_view, current_sort_mode)
-        elif key in ("RIGHT", "LEFT", "UP", "DOWN"):
-            # Handle cross-platform arrow keys
-            if key in ("RIGHT", "LEFT"):
-                current_index = (current_index + 1 if key == "RIGHT" else current_index - 1) % total
-                display_interface_schedule_with_sort(current_index, total, current_schedules, parsed_classes, 
-                                                   start_hour, end_hour, subject_colors, grid_view, current_sort_mode)
+            redraw = True
+        elif key in ("RIGHT", "LEFT"):
+            # Handle cross-platform arrow keys; with a single schedule the
+            # index wraps onto itself and there is nothing new to draw
+            new_index = (current_index + 1 if key == "RIGHT" else current_index - 1) % total
+            if new_index != current_index:
+                current_index = new_index
+                redraw = True
         elif key.lower() == "q":
             show_cursor()
             sys.exit(0)
@@ -370,57 +446,86 @@ def navigate_schedules(schedules: list[dict], parsed_classes: dict, start_hour:
     clear_screen()
 
 
+@lru_cache(maxsize=1)
+def _splash_text() -> str:
+    """Render the splash banner, which never changes, with pyfiglet once."""
+    # pyfiglet is only needed here, so one-shot commands don't pay for loading it
+    from pyfiglet import figlet_format
+    
+    return figlet_format("FIB   Manager", font="chunky")
+
+
+@lru_cache(maxsize=4)
+def _splash_banner(width: int) -> str:
+    """
+    Center every splash banner line for a terminal width.
+    
+    Args:
+        width: Terminal width in columns
+    
+    Returns:
+        The padded banner lines joined into a single block
+    """
+    return "\n".join(" " * max((width - len(line)) // 2, 0) + line for line in _splash_text().splitlines())
+
+
 def display_splash_screen() -> None:
     """Display the FIB Manager splash screen."""
     clear_screen()
     hide_cursor()
-    splash = figlet_format("FIB   Manager", font="chunky")
+    splash = _splash_text()
     subtitle = "Press any key to start"
     
-    top_pad = max((console.height - splash.count("\n") - 1) // 2, 0)
+    width, height = console.size
+    top_pad = max((height - splash.count("\n") - 1) // 2, 0)
     print("\n" * top_pad, end="")
     
-    for line in splash.splitlines():
-        pad = max((console.width - len(line)) // 2, 0)
-        console.print(" " * pad + line, style="accent", markup=False)
-    
-    console.print(subtitle, style="warning", justify="center")
+    with batched_output():
+        console.print(_splash_banner(width), style="accent")
+        console.print(subtitle, style="warning", justify="center")
     get_key_input()
 
 
-def display_subjects_list(quad: str, lang: str) -> None:
+def display_subjects_list(quad: str, lang: str,
+                          parsed_data: Optional[Dict[str, Any]] = None,
+                          names: Optional[Dict[str, str]] = None) -> None:
     """
     Display a list of subjects for a quadrimester.
     
     Args:
         quad: Quadrimester code
         lang: Language code
+        parsed_data: Already parsed class data, fetched when not given
+        names: Already fetched subject names, fetched when not given
     """
     from app.api import fetch_classes_data, fetch_subject_names
+    from app.core.parser import parse_classes_data
     
     clear_screen()
-    raw_data = fetch_classes_data(quad, lang)
-    parsed_data = parse_classes_data(raw_data)
-    names = fetch_subject_names(lang)
+    if parsed_data is None:
+        parsed_data = parse_classes_data(fetch_classes_data(quad, lang))
+    if names is None:
+        names = fetch_subject_names(lang)
     
     total = len(parsed_data)
 
-    header = Text("Subjects ", style="white") + Text(f"{total}", style="#FF5555")
-    console.rule(header, style="accent")
-    console.print()
+    with batched_output():
+        header = Text("Subjects ", style="white") + Text(f"{total}", style="#FF5555")
+        console.rule(header, style="accent")
+        console.print()
 
-    year, quad_num = quad.split("Q")
-    ordinal = "1st" if quad_num == "1" else "2nd" if quad_num == "2" else f"{quad_num}th"
+        year, quad_num = quad.split("Q")
+        ordinal = "1st" if quad_num == "1" else "2nd" if quad_num == "2" else f"{quad_num}th"
 
-    table = Table(title=f"Subjects of the {ordinal} quarter of {year}", header_style="bright_red")
-    table.add_column("Code", justify="right", style="bright_black", header_style="bold")
-    table.add_column("Name", style="white", header_style="bold")
-    
-    for subject in sorted(parsed_data.keys()):
-        table.add_row(subject, names.get(subject, subject))
-    
-    console.print(Align(table, align="center"))
-    console.print(Align(Text("\nE to leave\nQ to quit", style="accent", justify="center"), align="center"))
+        table = Table(title=f"Subjects of the {ordinal} quarter of {year}", header_style="bright_red")
+        table.add_column("Code", justify="right", style="bright_black", header_style="bold")
+        table.add_column("Name", style="white", header_style="bold")
+        
+        for subject in sorted(parsed_data.keys()):
+            table.add_row(subject, names.get(subject, subject))
+        
+        console.print(Align(table, align="center"))
+        console.print(Align(Text("\nE to leave\nQ to quit", style="accent", justify="center"), align="center"))
     
     while True:
         key = get_key_input()
@@ -447,51 +552,52 @@ def display_marks_results(formula: str, values: dict, target: float, solution: d
     clear_screen()
     hide_cursor()
     
-    header = Text("Marks Calculator", style="accent")
-    console.rule(header, style="accent")
-    console.print()
-      # Create a single comprehensive table
-    marks_table = Table(
-        header_style="secondary",
-        box=box.HORIZONTALS, 
-        title_style="bold white",
-        title_justify="center",
-        border_style="secondary",
-        show_header=True,
-        show_edge=False,
-        pad_edge=True,
-        highlight=False
-    )
-    marks_table.add_column("Formula", justify="center", style="white", header_style="bold")
-    marks_table.add_column(formula, justify="center", style="white", header_style="bold")
-    
-    # Add header row for variable section
-    marks_table.add_row(Text("", style="secondary"), Text("", style="secondary"))
-    
-    # Add all variable rows
-    variables = list(values.keys()) + list(solution.keys())
-    for var in sorted(variables):
-        if var in values:
-            # Known values - gray text
-            percentage = get_variable_percentage(formula, var)
-            row_text = f"{var} {percentage}"
-            marks_table.add_row(row_text, Text(f"{values[var]:.2f}", style="bold accent"))
-        else:
-            # Solution values - red text if not known
-            percentage = get_variable_percentage(formula, var)
-            row_text = f"{var} {percentage}"
-            marks_table.add_row(row_text, Text(f"{max(0, solution[var]):.2f}", style="red"))
-      # Add header row for results section
-    marks_table.add_row(Text("", style="secondary"), Text("", style="secondary"))
-    
-    # Add target and current result rows
-    marks_table.add_row(Text("Target", style="bold"), Text(f"{target:.2f}", style="bold accent"))
-    marks_table.add_row(Text("Mark", style="bold"), Text(f"{result:.2f}", style="bold"))
-    
-    console.print(marks_table, justify="center")
-    console.print()
-    
-    console.print("\nE to leave\nQ to quit", style="accent", justify="center")
+    with batched_output():
+        header = Text("Marks Calculator", style="accent")
+        console.rule(header, style="accent")
+        console.print()
+          # Create a single comprehensive table
+        marks_table = Table(
+            header_style="secondary",
+            box=box.HORIZONTALS, 
+            title_style="bold white",
+            title_justify="center",
+            border_style="secondary",
+            show_header=True,
+            show_edge=False,
+            pad_edge=True,
+            highlight=False
+        )
+        marks_table.add_column("Formula", justify="center", style="white", header_style="bold")
+        marks_table.add_column(formula, justify="center", style="white", header_style="bold")
+        
+        # Add header row for variable section
+        marks_table.add_row(Text("", style="secondary"), Text("", style="secondary"))
+        
+        # Add all variable rows
+        variables = list(values.keys()) + list(solution.keys())
+        for var in sorted(variables):
+            if var in values:
+                # Known values - gray text
+                percentage = get_variable_percentage(formula, var)
+                row_text = f"{var} {percentage}"
+                marks_table.add_row(row_text, Text(f"{values[var]:.2f}", style="bold accent"))
+            else:
+                # Solution values - red text if not known
+                percentage = get_variable_percentage(formula, var)
+                row_text = f"{var} {percentage}"
+                marks_table.add_row(row_text, Text(f"{max(0, solution[var]):.2f}", style="red"))
+          # Add header row for results section
+        marks_table.add_row(Text("", style="secondary"), Text("", style="secondary"))
+        
+        # Add target and current result rows
+        marks_table.add_row(Text("Target", style="bold"), Text(f"{target:.2f}", style="bold accent"))
+        marks_table.add_row(Text("Mark", style="bold"), Text(f"{result:.2f}", style="bold"))
+        
+        console.print(marks_table, justify="center")
+        console.print()
+        
+        console.print("\nE to leave\nQ to quit", style="accent", justify="center")
     
     while True:
         key = get_key_input()
@@ -504,6 +610,26 @@ def display_marks_results(formula: str, values: dict, target: float, solution: d
             sys.exit(0)
 
 
+@lru_cache(maxsize=32)
+def _parse_formula_coefficients(formula: str) -> Dict[str, float]:
+    """
+    Extract every variable's coefficient from a formula in a single pass.
+    
+    Args:
+        formula: The formula string (e.g., "EX1*0.4+EX2*0.6")
+    
+    Returns:
+        Dictionary mapping variable names to their coefficients
+    """
+    coefficients: Dict[str, float] = {}
+    # Look for patterns like "var*0.4" first, then "0.4*var"; the first match wins
+    for name, value in VAR_TIMES_COEFFICIENT_PATTERN.findall(formula):
+        coefficients.setdefault(name, float(value))
+    for value, name in COEFFICIENT_TIMES_VAR_PATTERN.findall(formula):
+        coefficients.setdefault(name, float(value))
+    return coefficients
+
+
 def get_variable_percentage(formula: str, var_name: str) -> str:
     """
     Extract the percentage (coefficient) for a variable from the formula if available.
@@ -515,13 +641,8 @@ def get_variable_percentage(formula: str, var_name: str) -> str:
     Returns:
         A formatted string with the percentage (e.g., "(40%)") or empty string if not found
     """
-    # Look for patterns like "var*0.4" or "0.4*var"
-    pattern1 = rf"{var_name}\s*\*\s*(0\.\d+)"
-    pattern2 = rf"(0\.\d+)\s*\*\s*{var_name}"
-    
-    match = re.search(pattern1, formula) or re.search(pattern2, formula)
-    if match:
-        coefficient = float(match.group(1))
+    coefficient = _parse_formula_coefficients(formula).get(var_name)
+    if coefficient is not None:
         percentage = int(coefficient * 100)
         return f"({percentage}%)"
     
@@ -4,11 +4,27 @@ Provides a minimal web interface for schedule management.
 """
 
 import os
+import time
+import hashlib
 import webbrowser
 import threading
-from typing import Dict, List, Any, Optional
+from concurrent.futures import Future
+from functools import wraps
+from typing import Callable, Dict, List, Any, Optional, Tuple
 
-from flask import Flask, render_template, request, jsonify, redirect, url_for
+from flask import Flask, Response, g, render_template, request, jsonify, redirect, url_for
+
+# orjson is an optional, much faster JSON encoder; Flask's own is used without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# flask-compress is optional; responses are sent uncompressed without it
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
 
 from app.core.utils import get_default_quadrimester, normalize_languages, parse_blacklist, parse_whitelist
 from app.core.parser import parse_classes_data, split_schedule_by_group_type
@@ -22,8 +38,201 @@ static_dir = os.path.join(os.path.dirname(__file__), 'static')
 app = Flask(__name__, template_folder=template_dir, static_folder=static_dir)
 app.config['SECRET_KEY'] = 'fib-manager-secret-key'
 
+# Schedule pages and JSON compress very well; skip responses too small to benefit
+app.config['COMPRESS_MIMETYPES'] = ['text/html', 'application/json']
+app.config['COMPRESS_LEVEL'] = 6
+app.config['COMPRESS_MIN_SIZE'] = 1024
+if Compress is not None:
+    Compress(app)
+
+
+# API data shared by all requests, refreshed after an hour: {key: (expiry, value)}
+CACHE_TTL_SECONDS = 3600
+_api_cache: Dict[Tuple[str, ...], Tuple[float, Any]] = {}
+# Loads in progress, so concurrent requests for the same key share one fetch
+_api_cache_loading: Dict[Tuple[str, ...], Future] = {}
+_api_cache_lock = threading.Lock()
+
+
+def get_cached(key: Tuple[str, ...], loader: Callable[[], Any]) -> Any:
+    """
+    Return a cached value, loading and caching it when missing or expired.
+    
+    The lock only guards the lookups and the store; the loader runs outside
+    it, so fetches for different keys proceed in parallel. Concurrent
+    requests for the same key wait for the first one's load instead of
+    fetching again. Empty values are not cached, so a failed request is
+    retried next time.
+    
+    Args:
+        key: Cache key
+        loader: Function producing the value
+    
+    Returns:
+        The cached or freshly loaded value
+    """
+    with _api_cache_lock:
+        now = time.monotonic()
+        entry = _api_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        pending = _api_cache_loading.get(key)
+        if pending is None:
+            future: Future = Future()
+            _api_cache_loading[key] = future
+    if pending is not None:
+        return pending.result()
+    
+    try:
+        value = loader()
+    except BaseException as e:
+        with _api_cache_lock:
+            del _api_cache_loading[key]
+        future.set_exception(e)
+        raise
+    with _api_cache_lock:
+        if value:
+            _api_cache[key] = (now + CACHE_TTL_SECONDS, value)
+        del _api_cache_loading[key]
+    future.set_result(value)
+    return value
+
+
+def get_parsed_classes(quad: str, lang: str) -> Dict[str, Any]:
+    """
+    Fetch and parse the class data of a quadrimester, cached across requests.
+    
+    Args:
+        quad: Quadrimester code
+        lang: Language code
+    
+    Returns:
+        Dictionary containing parsed class data
+    """
+    return get_cached(("classes", quad, lang), lambda: parse_classes_data(fetch_classes_data(quad, lang)))
+
+
+def get_subjects_list(quad: str, lang: str) -> List[Dict[str, str]]:
+    """
+    Build the sorted subject code and name list of a quadrimester, cached across requests.
+    
+    Args:
+        quad: Quadrimester code
+        lang: Language code
+    
+    Returns:
+        List of dictionaries with the code and name of each subject
+    """
+    def load() -> List[Dict[str, str]]:
+        parsed_data = get_parsed_classes(quad, lang)
+        names = get_cached(("names", lang), lambda: fetch_subject_names(lang))
+        return [
+            {'code': code, 'name': names.get(code, code)}
+            for code in sorted(parsed_data.keys())
+        ]
+    
+    return get_cached(("subjects", quad, lang), load)
+
+
+def fast_jsonify(data: Dict[str, Any]) -> Response:
+    """
+    Build a JSON response like jsonify, encoding with orjson when installed.
+    
+    The decoded data is the same, but the bytes are not: orjson writes
+    non-ASCII text (accented subject names) as raw UTF-8 where Flask escapes
+    it as \\uXXXX, and it never indents, even in debug mode. Both are valid
+    JSON for any client that parses the body.
+    
+    Args:
+        data: Data to serialize
+    
+    Returns:
+        Flask JSON response
+    """
+    if orjson is None:
+        return jsonify(data)
+    # Sorted keys and a trailing newline like Flask's provider; no ensure_ascii equivalent
+    body = orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return app.response_class(body, mimetype=app.json.mimetype)
+
+
+# Rendered pages by (path, view arguments), kept for five minutes: {key: (expiry, body, mimetype, etag)}
+VIEW_CACHE_TTL_SECONDS = 300
+VIEW_CACHE_MAX_ENTRIES = 256
+_view_cache: Dict[Tuple[Any, ...], Tuple[float, bytes, Optional[str], str]] = {}
+_view_cache_lock = threading.Lock()
+
+
+def skip_view_cache() -> None:
+    """Keep the response of the current request out of the view cache, e.g. an error page."""
+    g.skip_view_cache = True
+
+
+def store_view_cache(key: Tuple[Any, ...], entry: Tuple[float, bytes, Optional[str], str], now: float) -> None:
+    """
+    Add a rendered page to the view cache, evicting expired entries when it is full.
+    
+    If every entry is still fresh, the oldest ones are dropped instead, so the
+    cache never holds more than VIEW_CACHE_MAX_ENTRIES pages.
+    
+    Args:
+        key: Cache key
+        entry: (expiry, body, mimetype, etag) tuple
+        now: Current monotonic time
+    """
+    with _view_cache_lock:
+        _view_cache.pop(key, None)
+        if len(_view_cache) >= VIEW_CACHE_MAX_ENTRIES:
+            for expired in [k for k, (expiry, *_) in _view_cache.items() if expiry <= now]:
+                del _view_cache[expired]
+            while len(_view_cache) >= VIEW_CACHE_MAX_ENTRIES:
+                del _view_cache[next(iter(_view_cache))]
+        _view_cache[key] = entry
+
+
+def cached_view(*arg_names: str) -> Callable[[Callable[..., Any]], Callable[..., Response]]:
+    """
+    Decorate a GET view whose output only depends on its path and the given query arguments.
+    
+    The rendered body is cached for VIEW_CACHE_TTL_SECONDS and served with a
+    content ETag, so repeat requests skip Jinja and clients holding a fresh
+    copy get a 304 Not Modified. Only successful responses are cached, and
+    query arguments the view does not read are left out of the cache key.
+    
+    Args:
+        arg_names: Names of the query arguments the view reads
+    
+    Returns:
+        Decorator wrapping the view function
+    """
+    def decorator(view: Callable[..., Any]) -> Callable[..., Response]:
+        @wraps(view)
+        def wrapper(*args: Any, **kwargs: Any) -> Response:
+            key = (request.path, *(request.args.get(name) for name in arg_names))
+            now = time.monotonic()
+            with _view_cache_lock:
+                entry = _view_cache.get(key)
+            if entry is None or entry[0] <= now:
+                response = app.make_response(view(*args, **kwargs))
+                if response.status_code != 200 or response.is_streamed or g.get('skip_view_cache'):
+                    return response
+                body = response.get_data()
+                entry = (now + VIEW_CACHE_TTL_SECONDS, body, response.mimetype,
+                         hashlib.blake2b(body, digest_size=16).hexdigest())
+                store_view_cache(key, entry, now)
+            _, body, mimetype, etag = entry
+            response = app.response_class(body, mimetype=mimetype)
+            response.set_etag(etag)
+            response.make_conditional(request)
+            return response
+        
+        return wrapper
+    
+    return decorator
+
 
 @app.route('/')
+@cached_view()
 def index():
     """Home page with navigation to main features."""
     default_quad = get_default_quadrimester()
@@ -31,20 +240,17 @@ def index():
 
 
 @app.route('/subjects')
+@cached_view('quad', 'lang')
 def subjects():
     """Display subjects for a quadrimester."""
     quad = request.args.get('quad', get_default_quadrimester())
     lang = request.args.get('lang', 'en')
     
     try:
-        raw_data = fetch_classes_data(quad, lang)
-        parsed_data = parse_classes_data(raw_data)
-        names = fetch_subject_names(lang)
-        
-        subjects_list = [
-            {'code': code, 'name': names.get(code, code)}
-            for code in sorted(parsed_data.keys())
-        ]
+        subjects_list = get_subjects_list(quad, lang)
+        if not subjects_list:
+            # Probably a failed fetch, which get_cached retries: don't pin it here either
+            skip_view_cache()
         
         return render_template('subjects.html', 
                              subjects=subjects_list,
@@ -52,36 +258,36 @@ def subjects():
                              lang=lang,
                              default_quad=get_default_quadrimester())
     except Exception as e:
+        skip_view_cache()
         return render_template('error.html', error=str(e))
 
 
 @app.route('/subjects/api')
+@cached_view('quad', 'lang')
 def subjects_api():
     """API endpoint for subjects data."""
     quad = request.args.get('quad', get_default_quadrimester())
     lang = request.args.get('lang', 'en')
     
     try:
-        raw_data = fetch_classes_data(quad, lang)
-        parsed_data = parse_classes_data(raw_data)
-        names = fetch_subject_names(lang)
-        
-        subjects_list = [
-            {'code': code, 'name': names.get(code, code)}
-            for code in sorted(parsed_data.keys())
-        ]
+        subjects_list = get_subjects_list(quad, lang)
+        if not subjects_list:
+            # Probably a failed fetch, which get_cached retries: don't pin it here either
+            skip_view_cache()
         
-        return jsonify({
+        return fast_jsonify({
             'success': True,
             'quad': quad,
             'lang': lang,
             'subjects': subjects_list
         })
     except Exception as e:
+        skip_view_cache()
         return jsonify({'success': False, 'error': str(e)})
 
 
 @app.route('/search')
+@cached_view()
 def search():
     """Schedule search form."""
     default_quad = get_default_quadrimester()
@@ -127,18 +333,19 @@ def search_results():
         relax_days = 5 - max_days
         same_subgroup = not freedom
         
+        # Class data is shared by the search and the calendar view
+        parsed_data = get_parsed_classes(quad, 'en')
         result = get_schedule_combinations(
             quad, subjects, start_hour, end_hour,
             languages, same_subgroup, relax_days,
-            blacklist, whitelist, max_dead_hours
+            blacklist, whitelist, max_dead_hours,
+            parsed_schedule=parsed_data
         )
         
         # Process schedules for display
         schedules = result.get('schedules', [])
         
-        # Fetch class data for calendar view
-        raw_data = fetch_classes_data(quad, 'en')
-        parsed_data = parse_classes_data(raw_data)
+        # Split class data for calendar view
         group_schedule, subgroup_schedule = split_schedule_by_group_type(parsed_data)
         
         # Build class times data for each schedule
@@ -216,10 +423,11 @@ def search_api():
         result = get_schedule_combinations(
             quad, subjects, start_hour, end_hour,
             languages, same_subgroup, relax_days,
-            blacklist, whitelist, max_dead_hours
+            blacklist, whitelist, max_dead_hours,
+            parsed_schedule=get_parsed_classes(quad, 'en')
         )
         
-        return jsonify({
+        return fast_jsonify({
             'success': True,
             **result
         })
@@ -228,6 +436,7 @@ def search_api():
 
 
 @app.route('/about')
+@cached_view()
 def about():
     """About page."""
     return render_template('about.html', default_quad=get_default_quadrimester())
@@ -235,7 +444,6 @@ def about():
 
 def open_browser(port: int):
     """Open the web browser after a short delay."""
-    import time
     time.sleep(1.5)
     webbrowser.open(f'http://127.0.0.1:{port}')
 
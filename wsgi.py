@@ -1,5 +1,11 @@
 """
 WSGI entry point for production deployment (Railway, Heroku, etc.)
+
+Serve it with gunicorn, which reads its worker settings from gunicorn.conf.py:
+
+    gunicorn --bind 0.0.0.0:$PORT wsgi:app
+
+Running this file directly starts Flask's single-process development server.
 """
 import sys
 import os